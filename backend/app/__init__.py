@@ -1,9 +1,9 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-CTF竞赛平台后端主应用文件
+CTF竞赛平台后端应用包
 Author: sunsky
-功能：Flask应用初始化、蓝图注册、中间件配置
+功能：Flask应用工厂、扩展初始化、蓝图注册、中间件配置
 TODO: 添加WebSocket支持实时通知功能
 """
 
@@ -16,7 +16,7 @@ from flask_limiter import Limiter
 from flask_limiter.util import get_remote_address
 from flask_caching import Cache
 import os
-from datetime import timedelta
+from datetime import datetime, timedelta
 
 # 全局扩展实例
 db = SQLAlchemy()
@@ -46,12 +46,18 @@ def create_app(config_name=None):
     # 注册蓝图
     register_blueprints(app)
     
+    # 健康检查
+    register_health_check(app)
+    
     # 注册错误处理器
     register_error_handlers(app)
     
     # 注册中间件
     register_middleware(app)
     
+    # 注册命令行
+    register_commands(app)
+    
     return app
 
 
@@ -59,10 +65,22 @@ def init_extensions(app):
     """初始化Flask扩展"""
     db.init_app(app)
     migrate.init_app(app, db)
+    
+    # 导入模型，保证 db.create_all 与迁移能看到全部表
+    from app import models  # noqa: F401
     jwt.init_app(app)
     cache.init_app(app)
     limiter.init_app(app)
     
+    # 审计日志缓冲写入
+    from app.utils.audit import audit_log
+    audit_log.init_app(app)
+    
+    # 题目实例管理器（状态在进程内存中，只在开启的单个进程中运行）
+    if app.config.get('INSTANCE_MANAGER_ENABLED'):
+        from app.instances import instance_manager
+        instance_manager.init_app(app)
+    
     # CORS配置
     CORS(app, resources={
         r"/api/*": {
@@ -79,20 +97,17 @@ def init_extensions(app):
 
 def register_blueprints(app):
     """注册蓝图路由"""
-    from app.routes.auth import auth_bp
-    from app.routes.user import user_bp
-    from app.routes.challenge import challenge_bp
+    # TODO: 认证、用户、题目路由（/api/auth、/api/user、/api/challenge）待实现
     from app.routes.ranking import ranking_bp
     from app.routes.admin import admin_bp
     from app.routes.notification import notification_bp
+    from app.routes.instance import instance_bp
     
     # API路由前缀
-    app.register_blueprint(auth_bp, url_prefix='/api/auth')
-    app.register_blueprint(user_bp, url_prefix='/api/user')
-    app.register_blueprint(challenge_bp, url_prefix='/api/challenge')
     app.register_blueprint(ranking_bp, url_prefix='/api/ranking')
     app.register_blueprint(admin_bp, url_prefix='/api/admin')
     app.register_blueprint(notification_bp, url_prefix='/api/notification')
+    app.register_blueprint(instance_bp, url_prefix='/api/instance')
 
 
 def register_error_handlers(app):
@@ -167,17 +182,41 @@ def register_middleware(app):
         return response
 
 
-# 健康检查端点
-@app.route('/health')
-def health_check():
-    """健康检查接口"""
-    return jsonify({
-        'status': 'healthy',
-        'message': 'CTF平台运行正常',
-        'version': '1.0.0'
-    })
+def register_commands(app):
+    """注册命令行工具"""
+    import click
+    from flask.cli import AppGroup
+    
+    audit_cli = AppGroup('audit', help='审计日志维护')
+    
+    @audit_cli.command('ensure-partitions')
+    @click.option('--months-ahead', default=2, help='预建未来月份分区数')
+    def ensure_partitions_command(months_ahead):
+        """创建审计日志月分区（建议每天定时执行）"""
+        from app.controllers.audit import ensure_partitions
+        names = ensure_partitions(months_ahead)
+        click.echo(f'分区检查完成: {", ".join(names) or "非PostgreSQL，无需分区"}')
+    
+    @audit_cli.command('archive')
+    @click.option('--drop', is_flag=True, help='直接删除分区（默认仅分离以便导出归档）')
+    def archive_command(drop):
+        """归档超过保留期的审计日志"""
+        from app.controllers.audit import archive_partitions_before, month_start
+        cutoff = month_start(datetime.utcnow(), -app.config['AUDIT_LOG_RETENTION_MONTHS'])
+        result = archive_partitions_before(cutoff, drop=drop)
+        click.echo(f'归档完成（{cutoff:%Y-%m} 之前）: {result}')
+    
+    app.cli.add_command(audit_cli)
 
 
-if __name__ == '__main__':
-    app = create_app()
-    app.run(host='0.0.0.0', port=5000, debug=True)
\ No newline at end of file
+def register_health_check(app):
+    """注册健康检查端点"""
+    
+    @app.route('/health')
+    def health_check():
+        """健康检查接口"""
+        return jsonify({
+            'status': 'healthy',
+            'message': 'CTF平台运行正常',
+            'version': '1.0.0'
+        })
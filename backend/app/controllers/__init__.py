@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台业务逻辑包
+Author: sunsky
+功能：封装路由层调用的业务逻辑
+"""
@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台审计日志业务逻辑
+Author: sunsky
+功能：审计日志按月分区维护（创建、归档、删除）与查询
+说明：
+    PostgreSQL下 admin_logs 为按 created_at 范围分区的分区表，每月一个分区，
+    过期数据通过 DETACH/DROP 分区清理，代价与数据量无关；
+    其他数据库（开发环境SQLite）没有分区，退化为按时间DELETE
+"""
+
+from datetime import datetime
+import re
+
+from sqlalchemy import text
+
+from app import db
+from app.models import AdminLog
+
+PARTITION_PREFIX = 'admin_logs_'
+PARTITION_PATTERN = re.compile(r'^admin_logs_y(\d{4})m(\d{2})$')
+
+
+def _is_postgresql():
+    return db.engine.dialect.name == 'postgresql'
+
+
+def month_start(value, offset=0):
+    """获取某月（加偏移月数）的第一天"""
+    month_index = value.year * 12 + value.month - 1 + offset
+    return datetime(month_index // 12, month_index % 12 + 1, 1)
+
+
+def partition_name(month):
+    """分区表名，如 admin_logs_y2025m09"""
+    return f'{PARTITION_PREFIX}y{month.year:04d}m{month.month:02d}'
+
+
+def partition_statements(months_ahead=2, now=None):
+    """
+    生成默认分区及当月起若干个月分区的建表语句
+    Returns:
+        [(分区名, DDL语句)]，默认分区在最前
+    """
+    now = now or datetime.utcnow()
+    name = f'{PARTITION_PREFIX}default'
+    statements = [(name, f'CREATE TABLE IF NOT EXISTS {name} PARTITION OF admin_logs DEFAULT')]
+    for offset in range(months_ahead + 1):
+        start = month_start(now, offset)
+        end = month_start(now, offset + 1)
+        name = partition_name(start)
+        statements.append((name, (
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF admin_logs "
+            f"FOR VALUES FROM ('{start:%Y-%m-%d}') TO ('{end:%Y-%m-%d}')"
+        )))
+    return statements
+
+
+def ensure_partitions(months_ahead=2, now=None):
+    """
+    创建当月及未来若干个月的分区，以及兜底的默认分区
+    Returns:
+        本次检查的月分区名列表（非PostgreSQL返回空列表）
+    """
+    if not _is_postgresql():
+        return []
+
+    statements = partition_statements(months_ahead, now)
+    for _, statement in statements:
+        db.session.execute(text(statement))
+    db.session.commit()
+    return [name for name, _ in statements[1:]]
+
+
+def list_partitions():
+    """列出已有的月分区 [(分区名, 月份第一天)]，按时间升序"""
+    if not _is_postgresql():
+        return []
+
+    rows = db.session.execute(text(
+        "SELECT child.relname FROM pg_inherits "
+        "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+        "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+        "WHERE parent.relname = 'admin_logs'"
+    )).all()
+
+    partitions = []
+    for (name,) in rows:
+        match = PARTITION_PATTERN.match(name)
+        if match:
+            partitions.append((name, datetime(int(match.group(1)), int(match.group(2)), 1)))
+    return sorted(partitions, key=lambda item: item[1])
+
+
+def archive_partitions_before(cutoff, drop=False):
+    """
+    归档或删除早于 cutoff 所在月份的日志
+    Args:
+        cutoff: 截止时间，该时间所在月份之前的分区会被处理
+        drop: True 直接删除；False 仅从分区表分离（DETACH），
+              分离后的表可用 pg_dump 导出归档后再手动删除
+    Returns:
+        处理的分区名列表；非PostgreSQL返回删除的行数
+    """
+    boundary = month_start(cutoff)
+
+    if not _is_postgresql():
+        count = AdminLog.query.filter(AdminLog.created_at < boundary).delete(
+            synchronize_session=False
+        )
+        db.session.commit()
+        return count
+
+    handled = []
+    for name, month in list_partitions():
+        if month >= boundary:
+            break
+        db.session.execute(text(f'ALTER TABLE admin_logs DETACH PARTITION {name}'))
+        if drop:
+            db.session.execute(text(f'DROP TABLE {name}'))
+        handled.append(name)
+    db.session.commit()
+    return handled
+
+
+def query_logs(admin_id=None, target_type=None, target_id=None,
+               start=None, end=None, before_id=None, limit=50):
+    """
+    查询审计日志（键集分页）
+    Returns:
+        (日志列表, 下一页的before_id；没有更多时为None)
+    """
+    items = AdminLog.search(
+        admin_id=admin_id, target_type=target_type, target_id=target_id,
+        start=start, end=end, before_id=before_id, limit=limit + 1
+    )
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_before_id = str(items[-1].id) if has_more else None
+    return [item.to_dict() for item in items], next_before_id
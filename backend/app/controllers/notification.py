@@ -0,0 +1,190 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台通知业务逻辑
+Author: sunsky
+功能：个人通知批量写入、全站公告、未读计数缓存、收件箱键集分页
+"""
+
+from bisect import bisect_right
+
+from flask import current_app
+from sqlalchemy import func, insert
+
+from app import db, cache
+from app.models import Notification, Announcement, NotificationCursor
+
+# 缓存键
+UNREAD_KEY = 'notification:unread:{}'
+CURSOR_KEY = 'notification:announcement_cursor:{}'
+ANNOUNCEMENT_IDS_KEY = 'notification:announcement_ids'
+
+# 批量写入时每批的行数
+INSERT_BATCH_SIZE = 1000
+
+
+def get_cursor(user_id):
+    """获取用户已读游标，不存在时返回 (0, 0)"""
+    cursor = db.session.get(NotificationCursor, user_id)
+    if not cursor:
+        return 0, 0
+    return cursor.last_read_notification_id, cursor.last_read_announcement_id
+
+
+def get_announcement_ids():
+    """获取所有有效公告ID（升序，全站共享一份缓存）"""
+    ids = cache.get(ANNOUNCEMENT_IDS_KEY)
+    if ids is None:
+        ids = [
+            row[0] for row in db.session.query(Announcement.id)
+            .filter(Announcement.is_active.is_(True))
+            .order_by(Announcement.id).all()
+        ]
+        cache.set(ANNOUNCEMENT_IDS_KEY, ids, timeout=0)
+    return ids
+
+
+def get_unread_count(user_id):
+    """
+    获取未读数量
+    个人通知未读数与公告已读游标均缓存，命中时不访问数据库；
+    缓存设置有限过期时间，即使与并发写入交错产生偏差也会自动修正
+    Returns:
+        {'notifications': 个人通知未读数, 'announcements': 公告未读数, 'total': 合计}
+    """
+    unread_key = UNREAD_KEY.format(user_id)
+    cursor_key = CURSOR_KEY.format(user_id)
+    unread, announcement_cursor = cache.get_many(unread_key, cursor_key)
+
+    if unread is None or announcement_cursor is None:
+        notification_cursor, announcement_cursor = get_cursor(user_id)
+        unread = Notification.query.filter(
+            Notification.user_id == user_id,
+            Notification.id > notification_cursor
+        ).count()
+        cache.set_many(
+            {unread_key: unread, cursor_key: announcement_cursor},
+            timeout=current_app.config['NOTIFICATION_COUNTER_CACHE_TIMEOUT']
+        )
+
+    ids = get_announcement_ids()
+    announcements = len(ids) - bisect_right(ids, announcement_cursor)
+    return {
+        'notifications': unread,
+        'announcements': announcements,
+        'total': unread + announcements
+    }
+
+
+def send_notifications(user_ids, title, content=None, type='system', link=None):
+    """
+    向指定用户批量发送个人通知
+    使用批量INSERT写入，提交后递增已缓存的未读计数（有限过期时间兜底修正偏差）
+    Args:
+        user_ids: 接收用户ID列表
+    Returns:
+        写入的通知数量
+    """
+    user_ids = list(dict.fromkeys(user_ids))
+    rows = [
+        {'user_id': user_id, 'type': type, 'title': title, 'content': content, 'link': link}
+        for user_id in user_ids
+    ]
+    for start in range(0, len(rows), INSERT_BATCH_SIZE):
+        db.session.execute(insert(Notification), rows[start:start + INSERT_BATCH_SIZE])
+    db.session.commit()
+
+    # 只递增已缓存的计数，未缓存的在下次读取时从数据库计算；
+    # 递增结果与预期不符（读取后键过期被 inc 重新创建，或并发更新）时删除，交给下次读取重算；
+    # Flask-Caching 未代理 inc，直接调用后端（Redis 下为原子 INCR）
+    keys = [UNREAD_KEY.format(user_id) for user_id in user_ids]
+    for start in range(0, len(keys), INSERT_BATCH_SIZE):
+        batch = keys[start:start + INSERT_BATCH_SIZE]
+        for key, value in zip(batch, cache.get_many(*batch)):
+            if value is not None and cache.cache.inc(key) != value + 1:
+                cache.delete(key)
+
+    return len(rows)
+
+
+def publish_announcement(title, content, admin_id=None):
+    """发布全站公告：只写一行，不为每个用户生成通知"""
+    announcement = Announcement(title=title, content=content, created_by=admin_id)
+    db.session.add(announcement)
+    db.session.commit()
+
+    cache.delete(ANNOUNCEMENT_IDS_KEY)
+    return announcement
+
+
+def withdraw_announcement(announcement_id):
+    """撤回公告"""
+    announcement = db.session.get(Announcement, announcement_id)
+    if not announcement:
+        return None
+    announcement.is_active = False
+    db.session.commit()
+
+    cache.delete(ANNOUNCEMENT_IDS_KEY)
+    return announcement
+
+
+def mark_all_read(user_id):
+    """全部标记为已读：将已读游标推进到当前最新的通知与公告"""
+    latest_notification = db.session.query(func.max(Notification.id)).filter(
+        Notification.user_id == user_id
+    ).scalar() or 0
+    ids = get_announcement_ids()
+    latest_announcement = ids[-1] if ids else 0
+
+    cursor = db.session.get(NotificationCursor, user_id)
+    if not cursor:
+        cursor = NotificationCursor(user_id=user_id)
+        db.session.add(cursor)
+    cursor.last_read_notification_id = max(cursor.last_read_notification_id or 0, latest_notification)
+    cursor.last_read_announcement_id = max(cursor.last_read_announcement_id or 0, latest_announcement)
+    db.session.commit()
+
+    cache.set_many({
+        UNREAD_KEY.format(user_id): 0,
+        CURSOR_KEY.format(user_id): cursor.last_read_announcement_id
+    }, timeout=current_app.config['NOTIFICATION_COUNTER_CACHE_TIMEOUT'])
+
+
+def get_inbox(user_id, before_id=None, limit=20):
+    """
+    个人通知收件箱（键集分页，按ID倒序）
+    Args:
+        before_id: 上一页最后一条通知的ID，首页为None
+        limit: 每页条数
+    Returns:
+        (通知列表, 下一页的before_id；没有更多时为None)
+    """
+    query = Notification.query.filter(Notification.user_id == user_id)
+    if before_id:
+        query = query.filter(Notification.id < before_id)
+    items = query.order_by(Notification.id.desc()).limit(limit + 1).all()
+
+    last_read_id, _ = get_cursor(user_id)
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_before_id = items[-1].id if has_more else None
+    return [item.to_dict(last_read_id) for item in items], next_before_id
+
+
+def get_announcements(user_id, before_id=None, limit=20):
+    """
+    全站公告列表（键集分页，按ID倒序）
+    Returns:
+        (公告列表, 下一页的before_id；没有更多时为None)
+    """
+    query = Announcement.query.filter(Announcement.is_active.is_(True))
+    if before_id:
+        query = query.filter(Announcement.id < before_id)
+    items = query.order_by(Announcement.id.desc()).limit(limit + 1).all()
+
+    _, last_read_id = get_cursor(user_id)
+    has_more = len(items) > limit
+    items = items[:limit]
+    next_before_id = items[-1].id if has_more else None
+    return [item.to_dict(last_read_id) for item in items], next_before_id
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台排行榜业务逻辑
+Author: sunsky
+功能：实时排行榜、封榜快照、赛后揭榜事件回放
+"""
+
+from datetime import datetime
+import json
+
+from flask import current_app
+from sqlalchemy.exc import IntegrityError
+
+from app import db, cache
+from app.models import User, UserProfile, Submission, Challenge, ScoreboardSnapshot
+
+# 缓存键
+ACTIVE_SNAPSHOT_KEY = 'scoreboard:active_snapshot'
+SNAPSHOT_KEY = 'scoreboard:snapshot:{}'
+REVEAL_EVENTS_KEY = 'scoreboard:reveal_events:{}'
+
+# 未封榜标记（缓存中None表示未命中，需要单独的占位值）
+NOT_FROZEN = 0
+
+
+def get_live_scoreboard(limit=None):
+    """
+    查询实时排行榜
+    Args:
+        limit: 返回条数，None表示全部
+    Returns:
+        排行榜条目列表（按总分降序，同分按解题数降序）
+    """
+    query = db.session.query(
+        User.id, User.username, UserProfile.nickname,
+        UserProfile.total_score, UserProfile.solved_count
+    ).join(UserProfile, UserProfile.user_id == User.id).filter(
+        User.is_active.is_(True),
+        User.is_admin.is_(False)
+    ).order_by(
+        UserProfile.total_score.desc(),
+        UserProfile.solved_count.desc(),
+        User.id
+    )
+    if limit:
+        query = query.limit(limit)
+
+    return [
+        {
+            'rank': index + 1,
+            'user_id': user_id,
+            'username': username,
+            'nickname': nickname,
+            'total_score': total_score,
+            'solved_count': solved_count
+        }
+        for index, (user_id, username, nickname, total_score, solved_count) in enumerate(query.all())
+    ]
+
+
+def get_active_snapshot_id():
+    """获取当前封榜快照ID，未封榜返回None（结果缓存，封榜期间读排行榜不访问数据库）"""
+    snapshot_id = cache.get(ACTIVE_SNAPSHOT_KEY)
+    if snapshot_id is None:
+        snapshot = ScoreboardSnapshot.get_active()
+        snapshot_id = snapshot.id if snapshot else NOT_FROZEN
+        cache.set(ACTIVE_SNAPSHOT_KEY, snapshot_id, timeout=0)
+    return snapshot_id or None
+
+
+def get_snapshot_payload(snapshot_id):
+    """
+    获取快照的公开内容（快照不可变，永久缓存）
+    快照保存完整排名用于揭榜回放，公开读取与实时排行榜一样只返回前 SCOREBOARD_SIZE 名；
+    只包含封榜后不再变化的字段，揭榜状态（is_active、revealed_at）不在其中
+    """
+    key = SNAPSHOT_KEY.format(snapshot_id)
+    payload = cache.get(key)
+    if payload is None:
+        snapshot = db.session.get(ScoreboardSnapshot, snapshot_id)
+        if not snapshot:
+            return None
+        payload = {
+            'id': snapshot.id,
+            'frozen_at': snapshot.frozen_at.isoformat(),
+            'entries': snapshot.get_entries()[:current_app.config['SCOREBOARD_SIZE']]
+        }
+        cache.set(key, payload, timeout=0)
+    return payload
+
+
+def freeze_scoreboard(admin_id=None):
+    """
+    封榜：保存当前排行榜快照
+    Args:
+        admin_id: 执行封榜的管理员ID
+    Returns:
+        (快照, 错误信息)
+    """
+    if ScoreboardSnapshot.get_active():
+        return None, '排行榜已处于封榜状态'
+
+    snapshot = ScoreboardSnapshot(
+        created_by=admin_id,
+        data=json.dumps(get_live_scoreboard(), ensure_ascii=False),
+        frozen_at=datetime.utcnow()
+    )
+    db.session.add(snapshot)
+    try:
+        db.session.commit()
+    except IntegrityError:
+        # 并发封榜：生效快照的唯一索引保证只有一个成功
+        db.session.rollback()
+        return None, '排行榜已处于封榜状态'
+
+    cache.set(ACTIVE_SNAPSHOT_KEY, snapshot.id, timeout=0)
+    return snapshot, None
+
+
+def reveal_scoreboard():
+    """
+    揭榜：结束封榜，公开排行榜恢复为实时数据
+    Returns:
+        (快照, 错误信息)
+    """
+    snapshot = ScoreboardSnapshot.get_active()
+    if not snapshot:
+        return None, '排行榜未封榜'
+
+    snapshot.is_active = False
+    snapshot.revealed_at = datetime.utcnow()
+    db.session.commit()
+
+    cache.set(ACTIVE_SNAPSHOT_KEY, NOT_FROZEN, timeout=0)
+    return snapshot, None
+
+
+def get_reveal_events(snapshot):
+    """
+    获取揭榜事件
+    揭榜后事件不再变化，按快照永久缓存，所有观众共享一份；揭榜前（管理员预览）实时计算
+    """
+    if snapshot.is_active:
+        return build_reveal_events(snapshot)
+
+    key = REVEAL_EVENTS_KEY.format(snapshot.id)
+    events = cache.get(key)
+    if events is None:
+        events = build_reveal_events(snapshot)
+        cache.set(key, events, timeout=0)
+    return events
+
+
+def build_reveal_events(snapshot):
+    """
+    生成揭榜事件：按时间顺序回放封榜期间的正确提交
+    Args:
+        snapshot: 封榜快照
+    Returns:
+        事件列表，每个事件包含解题信息以及该时刻的分数与排名
+    """
+    entries = snapshot.get_entries()
+    scores = {entry['user_id']: entry['total_score'] for entry in entries}
+    names = {entry['user_id']: entry['username'] for entry in entries}
+
+    # 封榜前已解出的题目不重复计分
+    solved = set(
+        db.session.query(Submission.user_id, Submission.challenge_id).filter(
+            Submission.is_correct.is_(True),
+            Submission.created_at < snapshot.frozen_at
+        ).distinct().all()
+    )
+
+    end_time = snapshot.revealed_at or datetime.utcnow()
+    rows = db.session.query(
+        Submission.user_id, Submission.challenge_id, Challenge.title,
+        Challenge.points, Submission.created_at
+    ).join(Challenge, Challenge.id == Submission.challenge_id).filter(
+        Submission.is_correct.is_(True),
+        Submission.created_at >= snapshot.frozen_at,
+        Submission.created_at <= end_time
+    ).order_by(Submission.created_at, Submission.id).all()
+
+    events = []
+    for user_id, challenge_id, title, points, solved_at in rows:
+        if (user_id, challenge_id) in solved or user_id not in scores:
+            continue
+        solved.add((user_id, challenge_id))
+
+        old_rank = 1 + sum(1 for score in scores.values() if score > scores[user_id])
+        scores[user_id] += points
+        new_rank = 1 + sum(1 for score in scores.values() if score > scores[user_id])
+
+        events.append({
+            'user_id': user_id,
+            'username': names[user_id],
+            'challenge_id': challenge_id,
+            'challenge_title': title,
+            'points': points,
+            'solved_at': solved_at.isoformat(),
+            'total_score': scores[user_id],
+            'old_rank': old_rank,
+            'new_rank': new_rank
+        })
+    return events
@@ -0,0 +1,17 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例编排包
+Author: sunsky
+功能：按队伍分配题目独立实例，预热池、TTL回收、配额限制与运行时插件
+"""
+
+from .manager import InstanceManager, instance_manager
+from .pool import WarmPool
+from .runtime import Instance, InstanceRuntime, DockerRuntime, LocalProcessRuntime, RUNTIMES
+
+__all__ = [
+    'InstanceManager', 'instance_manager',
+    'WarmPool',
+    'Instance', 'InstanceRuntime', 'DockerRuntime', 'LocalProcessRuntime', 'RUNTIMES'
+]
@@ -0,0 +1,368 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例管理器
+Author: sunsky
+功能：为Web/Pwn等题目按队伍分配独立实例——预热池命中直接分配，
+      TTL到期自动回收，限制每队实例配额，统计池命中率与实例就绪耗时
+说明：
+    实例状态保存在进程内存中，管理器只能在一个进程中运行：
+    仅在 INSTANCE_MANAGER_ENABLED 开启的进程（单独的单worker实例服务）中初始化，
+    多worker各自维护预热池会重复占用资源，且实例只能由创建它的worker释放
+"""
+
+import atexit
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+import math
+import threading
+import time
+
+from .pool import WarmPool
+from .runtime import RUNTIMES
+
+
+def _percentile(values, pct):
+    """最近秩法分位数"""
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[max(1, math.ceil(pct / 100.0 * len(values))) - 1]
+
+
+class ChallengeMetrics:
+    """单道题目的分配统计"""
+
+    def __init__(self, window=1000):
+        self.hits = 0
+        self.misses = 0
+        self.time_to_instance = deque(maxlen=window)
+
+    def to_dict(self):
+        total = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 4) if total else 0.0,
+            'time_to_instance_p50_ms': round(_percentile(self.time_to_instance, 50) * 1000, 2),
+            'time_to_instance_p99_ms': round(_percentile(self.time_to_instance, 99) * 1000, 2)
+        }
+
+
+class InstanceManager:
+    """题目实例管理器"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self.runtime = None
+        self.pools = {}
+        self.assigned = {}
+        self.metrics = {}
+        self._pending = []
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._executor = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app, runtime=None):
+        """
+        初始化
+        Args:
+            runtime: 自定义运行时实例，默认按 INSTANCE_RUNTIME 配置创建
+        """
+        self.app = app
+        self.ttl = timedelta(seconds=app.config.get('INSTANCE_TTL', 3600))
+        self.team_quota = app.config.get('INSTANCE_TEAM_QUOTA', 3)
+        self.low_watermark = app.config.get('INSTANCE_POOL_LOW_WATERMARK', 2)
+        self.high_watermark = app.config.get('INSTANCE_POOL_HIGH_WATERMARK', 5)
+        self.reap_interval = app.config.get('INSTANCE_REAP_INTERVAL', 30)
+        self.max_concurrent_starts = app.config.get('INSTANCE_MAX_CONCURRENT_STARTS', 4)
+        self._start_slots = threading.BoundedSemaphore(self.max_concurrent_starts)
+        self._runtime_name = app.config.get('INSTANCE_RUNTIME', 'docker')
+        self._runtime_host = app.config.get('INSTANCE_HOST', '127.0.0.1')
+        if runtime is not None:
+            self.runtime = runtime
+
+        for challenge_id, spec in app.config.get('INSTANCE_CHALLENGES', {}).items():
+            self.register(challenge_id, spec)
+
+        app.extensions['instance_manager'] = self
+        atexit.register(self.shutdown)
+
+        # 启动即预热，不等到第一次申请
+        self._ensure_worker()
+
+    def _get_runtime(self):
+        """惰性创建运行时（Docker客户端只在真正使用时连接）"""
+        if self.runtime is None:
+            self.runtime = RUNTIMES[self._runtime_name](host=self._runtime_host)
+        return self.runtime
+
+    def _ensure_worker(self):
+        """启动后台回收线程与预热启动线程池"""
+        if self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            # 预热启动在独立线程池中异步进行，后台线程提交后立即返回，不因大批启动而推迟回收
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_concurrent_starts, thread_name_prefix='instance-start'
+            )
+            self._thread = threading.Thread(target=self._run, name='instance-manager', daemon=True)
+            self._thread.start()
+
+    def register(self, challenge_id, spec):
+        """
+        注册需要独立实例的题目
+        Args:
+            challenge_id: 题目ID
+            spec: 实例规格，如 {'image': 'qhuctf/web-001', 'port': 80}；
+                  可单独指定 low_watermark / high_watermark / ttl
+        """
+        with self._lock:
+            old_pool = self.pools.get(challenge_id)
+            self.pools[challenge_id] = WarmPool(
+                challenge_id, spec, self.low_watermark, self.high_watermark
+            )
+            self.metrics.setdefault(challenge_id, ChallengeMetrics())
+        # 重复注册（如修改规格）时销毁旧池中按旧规格启动的实例
+        if old_pool:
+            for instance in old_pool.drain():
+                self._get_runtime().stop(instance)
+        self._wakeup.set()
+
+    def unregister(self, challenge_id):
+        """取消注册并销毁该题目的预热实例（已分配的实例到期后回收）"""
+        with self._lock:
+            pool = self.pools.pop(challenge_id, None)
+        if pool:
+            for instance in pool.drain():
+                self._get_runtime().stop(instance)
+
+    def _start(self, challenge_id, spec):
+        """启动实例（限制同时启动的数量，避免放题时压垮宿主机）"""
+        with self._start_slots:
+            instance = self._get_runtime().start(challenge_id, spec)
+        instance.created_at = datetime.utcnow()
+        return instance
+
+    def get_team_instances(self, team_id):
+        """获取队伍当前持有的实例"""
+        with self._lock:
+            return [instance for instance in self.assigned.values() if instance.team_id == team_id]
+
+    def acquire(self, challenge_id, team_id):
+        """
+        为队伍分配实例
+        队伍已持有该题实例时直接返回；否则优先从预热池取，池空时冷启动
+        Returns:
+            (实例, 错误信息)
+        """
+        self._ensure_worker()
+        pool = self.pools.get(challenge_id)
+        if pool is None:
+            return None, '该题目不需要独立实例'
+
+        key = (team_id, challenge_id)
+        with self._lock:
+            owned = [i for i in self.assigned.values() if i.team_id == team_id]
+            for instance in owned:
+                if instance.challenge_id == challenge_id:
+                    return instance, None
+            if key in self._pending:
+                return None, '实例正在启动中，请稍后'
+            pending = sum(1 for pending_team, _ in self._pending if pending_team == team_id)
+            if len(owned) + pending >= self.team_quota:
+                return None, f'每支队伍最多同时持有 {self.team_quota} 个实例'
+            # 先占位，避免并发请求突破配额
+            self._pending.append(key)
+
+        started = time.perf_counter()
+        try:
+            runtime = self._get_runtime()
+            instance = pool.take()
+            while instance is not None and not runtime.is_alive(instance):
+                runtime.stop(instance)
+                instance = pool.take()
+            hit = instance is not None
+            if not hit:
+                instance = self._start(challenge_id, pool.spec)
+        except Exception as e:
+            with self._lock:
+                self._pending.remove(key)
+            self.app.logger.error('题目 %s 实例启动失败: %s', challenge_id, e)
+            return None, '实例启动失败，请稍后重试'
+        elapsed = time.perf_counter() - started
+
+        now = datetime.utcnow()
+        instance.team_id = team_id
+        instance.assigned_at = now
+        instance.expires_at = now + timedelta(seconds=pool.spec.get('ttl', self.ttl.total_seconds()))
+
+        with self._lock:
+            self._pending.remove(key)
+            self.assigned[instance.id] = instance
+            metrics = self.metrics[challenge_id]
+            if hit:
+                metrics.hits += 1
+            else:
+                metrics.misses += 1
+            metrics.time_to_instance.append(elapsed)
+
+        # 取走实例后唤醒后台线程检查水位
+        self._wakeup.set()
+        return instance, None
+
+    def release(self, instance_id, team_id):
+        """
+        队伍释放自己的实例（实例已被选手使用过，直接销毁，不放回预热池）
+        Args:
+            team_id: 队伍ID，只能释放本队持有的实例
+        Returns:
+            是否释放成功
+        """
+        if team_id is None:
+            return False
+        return self._release(instance_id, team_id)
+
+    def force_release(self, instance_id):
+        """管理员强制释放任意实例"""
+        return self._release(instance_id, None)
+
+    def _release(self, instance_id, team_id):
+        """释放实例，team_id 为None时不校验归属（仅供 force_release 使用）"""
+        with self._lock:
+            instance = self.assigned.get(instance_id)
+            if instance is None:
+                return False
+            if team_id is not None and instance.team_id != team_id:
+                return False
+            del self.assigned[instance_id]
+        self._get_runtime().stop(instance)
+        return True
+
+    def reap(self, now=None):
+        """
+        回收到期实例，并剔除预热池中已退出的实例
+        Returns:
+            回收的实例数
+        """
+        now = now or datetime.utcnow()
+        with self._lock:
+            expired = [
+                instance for instance in self.assigned.values()
+                if instance.expires_at <= now
+            ]
+            for instance in expired:
+                del self.assigned[instance.id]
+            pools = list(self.pools.values())
+
+        runtime = self._get_runtime()
+        for instance in expired:
+            runtime.stop(instance)
+
+        for pool in pools:
+            for instance in pool.prune(runtime.is_alive):
+                runtime.stop(instance)
+        return len(expired)
+
+    def refill(self):
+        """
+        将低于低水位的预热池补充到高水位
+        只提交启动任务不等待完成，已提交的启动计入 pool.starting，重复调用不会超额补充
+        """
+        self._ensure_worker()
+        with self._lock:
+            pools = list(self.pools.values())
+
+        for pool in pools:
+            for _ in range(pool.reserve()):
+                self._executor.submit(self._refill_one, pool)
+
+    def _refill_one(self, pool):
+        """为预热池启动一个实例"""
+        instance = None
+        try:
+            if not self._stop.is_set():
+                instance = self._start(pool.challenge_id, pool.spec)
+        except Exception as e:
+            self.app.logger.error('题目 %s 预热实例启动失败: %s', pool.challenge_id, e)
+
+        # 启动期间题目可能已被取消注册/重新注册或管理器已关闭，此时放回旧池的实例永远不会被回收
+        with self._lock:
+            registered = not self._stop.is_set() and self.pools.get(pool.challenge_id) is pool
+            pool.finish_start(instance if registered else None)
+        if instance is not None and not registered:
+            self._get_runtime().stop(instance)
+
+    def _run(self):
+        """后台线程：定时回收到期实例，被唤醒或定时补充预热池"""
+        last_reap = 0.0
+        while not self._stop.is_set():
+            self._wakeup.clear()
+            if time.monotonic() - last_reap >= self.reap_interval:
+                self.reap()
+                last_reap = time.monotonic()
+            self.refill()
+            self._wakeup.wait(self.reap_interval)
+
+    def get_metrics(self):
+        """获取池命中率、实例就绪耗时等统计"""
+        with self._lock:
+            result = {}
+            hits = misses = 0
+            for challenge_id, pool in self.pools.items():
+                metrics = self.metrics[challenge_id]
+                hits += metrics.hits
+                misses += metrics.misses
+                data = metrics.to_dict()
+                data.update({
+                    'ready': len(pool),
+                    'starting': pool.starting,
+                    'assigned': sum(
+                        1 for instance in self.assigned.values()
+                        if instance.challenge_id == challenge_id
+                    ),
+                    'low_watermark': pool.low_watermark,
+                    'high_watermark': pool.high_watermark
+                })
+                result[str(challenge_id)] = data
+
+        total = hits + misses
+        return {
+            'hit_rate': round(hits / total, 4) if total else 0.0,
+            'hits': hits,
+            'misses': misses,
+            'challenges': result
+        }
+
+    def shutdown(self):
+        """停止后台线程并销毁全部实例"""
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread:
+            self._thread.join(10)
+        if self._executor:
+            # 等待进行中的启动结束（其实例会在 _refill_one 中直接销毁）
+            self._executor.shutdown(wait=True, cancel_futures=True)
+        if self.runtime is None:
+            return
+
+        with self._lock:
+            instances = list(self.assigned.values())
+            self.assigned.clear()
+            pools = list(self.pools.values())
+        for pool in pools:
+            instances.extend(pool.drain())
+        for instance in instances:
+            self.runtime.stop(instance)
+
+
+# 全局实例管理器
+instance_manager = InstanceManager()
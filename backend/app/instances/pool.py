@@ -0,0 +1,77 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例预热池
+Author: sunsky
+功能：每道题目维护一组预先启动的实例，按高低水位补充
+"""
+
+from collections import deque
+import threading
+
+
+class WarmPool:
+    """
+    单道题目的预热池
+    就绪实例数（含正在启动的）低于低水位时补充到高水位，
+    避免每分配一个实例就触发一次启动
+    """
+
+    def __init__(self, challenge_id, spec, low_watermark, high_watermark):
+        self.challenge_id = challenge_id
+        self.spec = spec
+        self.low_watermark = spec.get('low_watermark', low_watermark)
+        self.high_watermark = max(spec.get('high_watermark', high_watermark), self.low_watermark)
+        self.ready = deque()
+        self.starting = 0
+        self.lock = threading.Lock()
+
+    def take(self):
+        """取出一个就绪实例，池空时返回None"""
+        with self.lock:
+            return self.ready.popleft() if self.ready else None
+
+    def reserve(self):
+        """
+        计算需要补充的实例数，并计入启动中数量
+        Returns:
+            本次应启动的实例数（未低于低水位时为0）
+        """
+        with self.lock:
+            available = len(self.ready) + self.starting
+            if available >= self.low_watermark:
+                return 0
+            count = self.high_watermark - available
+            self.starting += count
+            return count
+
+    def finish_start(self, instance=None):
+        """一次补充启动结束（失败时instance为None）"""
+        with self.lock:
+            self.starting -= 1
+            if instance is not None:
+                self.ready.append(instance)
+
+    def prune(self, is_alive):
+        """
+        剔除已退出的就绪实例（存活检查在锁外进行，不阻塞分配）
+        Returns:
+            被剔除的实例列表
+        """
+        with self.lock:
+            candidates = list(self.ready)
+        dead = [instance for instance in candidates if not is_alive(instance)]
+        if dead:
+            with self.lock:
+                self.ready = deque(instance for instance in self.ready if instance not in dead)
+        return dead
+
+    def drain(self):
+        """取出全部就绪实例（用于关闭或删除题目）"""
+        with self.lock:
+            instances = list(self.ready)
+            self.ready.clear()
+            return instances
+
+    def __len__(self):
+        return len(self.ready)
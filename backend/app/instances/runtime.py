@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例运行时
+Author: sunsky
+功能：可插拔的实例运行时——Docker容器（生产）与本地进程（开发/测试）
+"""
+
+import socket
+import subprocess
+import sys
+import uuid
+
+
+class Instance:
+    """题目实例"""
+
+    def __init__(self, instance_id, challenge_id, handle, host, port):
+        self.id = instance_id
+        self.challenge_id = challenge_id
+        self.handle = handle
+        self.host = host
+        self.port = port
+
+        # 分配信息（预热池中的实例未分配）
+        self.team_id = None
+        self.created_at = None
+        self.assigned_at = None
+        self.expires_at = None
+
+    def to_dict(self):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'challenge_id': self.challenge_id,
+            'host': self.host,
+            'port': self.port,
+            'team_id': self.team_id,
+            'assigned_at': self.assigned_at.isoformat() if self.assigned_at else None,
+            'expires_at': self.expires_at.isoformat() if self.expires_at else None
+        }
+
+    def __repr__(self):
+        return f'<Instance {self.challenge_id} {self.host}:{self.port}>'
+
+
+class InstanceRuntime:
+    """实例运行时基类"""
+
+    def start(self, challenge_id, spec):
+        """
+        启动一个实例
+        Args:
+            challenge_id: 题目ID
+            spec: 实例规格（镜像、端口、资源限制等）
+        Returns:
+            Instance
+        """
+        raise NotImplementedError
+
+    def stop(self, instance):
+        """停止并销毁实例"""
+        raise NotImplementedError
+
+    def is_alive(self, instance):
+        """实例是否仍在运行"""
+        raise NotImplementedError
+
+
+class DockerRuntime(InstanceRuntime):
+    """Docker容器运行时"""
+
+    def __init__(self, host='127.0.0.1', base_url=None):
+        try:
+            import docker
+        except ImportError:
+            raise RuntimeError('使用Docker运行时需要安装 docker 库: pip install docker')
+
+        self.host = host
+        self.client = docker.DockerClient(base_url=base_url) if base_url else docker.from_env()
+
+    def start(self, challenge_id, spec):
+        container_port = f"{spec.get('port', 80)}/tcp"
+        container = self.client.containers.run(
+            spec['image'],
+            detach=True,
+            ports={container_port: None},
+            environment=spec.get('environment'),
+            mem_limit=spec.get('mem_limit', '256m'),
+            nano_cpus=int(spec.get('cpus', 0.5) * 1e9),
+            labels={'ctf.challenge': str(challenge_id)}
+        )
+        container.reload()
+        host_port = int(container.attrs['NetworkSettings']['Ports'][container_port][0]['HostPort'])
+        return Instance(container.id[:12], challenge_id, container, self.host, host_port)
+
+    def stop(self, instance):
+        try:
+            instance.handle.remove(force=True)
+        except Exception:
+            # 容器可能已被外部删除
+            pass
+
+    def is_alive(self, instance):
+        try:
+            instance.handle.reload()
+        except Exception:
+            return False
+        return instance.handle.status == 'running'
+
+
+class LocalProcessRuntime(InstanceRuntime):
+    """
+    本地进程运行时（开发/测试用）
+    每个实例是一个本地子进程，默认运行 python -m http.server；
+    spec['command'] 可自定义命令，其中的 {port} 会被替换为分配的端口
+    """
+
+    DEFAULT_COMMAND = [sys.executable, '-m', 'http.server', '{port}', '--bind', '127.0.0.1']
+
+    def __init__(self, host='127.0.0.1'):
+        self.host = host
+
+    @staticmethod
+    def _free_port():
+        with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start(self, challenge_id, spec):
+        port = self._free_port()
+        command = [part.format(port=port) for part in spec.get('command', self.DEFAULT_COMMAND)]
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL
+        )
+        return Instance(uuid.uuid4().hex[:12], challenge_id, process, self.host, port)
+
+    def stop(self, instance):
+        process = instance.handle
+        if process.poll() is None:
+            process.terminate()
+            try:
+                process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+
+    def is_alive(self, instance):
+        return instance.handle.poll() is None
+
+
+# 运行时名称与类的对应关系
+RUNTIMES = {
+    'docker': DockerRuntime,
+    'local': LocalProcessRuntime
+}
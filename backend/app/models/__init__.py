@@ -10,14 +10,16 @@ from .user import User, UserProfile
 from .challenge import Challenge, Category, Tag, ChallengeTag
 from .submission import Submission, Flag
 from .team import Team, TeamMember
-from .notification import Notification
+from .notification import Notification, Announcement, NotificationCursor
 from .admin import AdminLog
+from .scoreboard import ScoreboardSnapshot
 
 __all__ = [
     'User', 'UserProfile',
     'Challenge', 'Category', 'Tag', 'ChallengeTag',
     'Submission', 'Flag',
     'Team', 'TeamMember',
-    'Notification',
-    'AdminLog'
+    'Notification', 'Announcement', 'NotificationCursor',
+    'AdminLog',
+    'ScoreboardSnapshot'
 ]
\ No newline at end of file
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台管理员审计日志模型
+Author: sunsky
+功能：记录管理员操作，PostgreSQL下按月分区存储
+说明：
+    分区表的主键必须包含分区键，因此主键为 (id, created_at)；
+    id 由应用端生成（按时间递增），保证批量写入前即可确定且全局有序；
+    分区表本身不能存数据，建表后立即创建默认分区与当月、下月分区
+"""
+
+from datetime import datetime
+import json
+
+from sqlalchemy import event, text
+
+from app import db
+
+
+class AdminLog(db.Model):
+    """管理员操作日志模型"""
+    __tablename__ = 'admin_logs'
+    __table_args__ = (
+        # 查询按 id 倒序做键集分页，筛选列后接 id，索引可直接提供排序与 id < before_id 的范围
+        db.Index('ix_admin_logs_admin_id_id', 'admin_id', 'id'),
+        db.Index('ix_admin_logs_target_id', 'target_type', 'target_id', 'id'),
+        db.Index('ix_admin_logs_created_at', 'created_at'),
+        {'postgresql_partition_by': 'RANGE (created_at)'}
+    )
+
+    # 基础字段
+    id = db.Column(db.BigInteger, primary_key=True, autoincrement=False)
+    created_at = db.Column(db.DateTime, primary_key=True, default=datetime.utcnow)
+
+    # 操作者（不加外键约束，用户删除后日志仍需保留）
+    admin_id = db.Column(db.Integer, nullable=False)
+
+    # 操作内容
+    action = db.Column(db.String(50), nullable=False)
+    target_type = db.Column(db.String(50))
+    target_id = db.Column(db.String(64))
+    details = db.Column(db.Text)
+    ip_address = db.Column(db.String(45))
+
+    @classmethod
+    def search(cls, admin_id=None, target_type=None, target_id=None,
+               start=None, end=None, before_id=None, limit=50):
+        """
+        按操作者、操作对象、时间范围查询（键集分页，按ID倒序）
+        Args:
+            admin_id: 操作者ID
+            target_type: 操作对象类型，如 'user'、'challenge'
+            target_id: 操作对象ID
+            start: 起始时间（含）
+            end: 结束时间（不含）
+            before_id: 上一页最后一条日志的ID
+            limit: 每页条数
+        """
+        query = cls.query
+        if admin_id is not None:
+            query = query.filter(cls.admin_id == admin_id)
+        if target_type:
+            query = query.filter(cls.target_type == target_type)
+        if target_id is not None:
+            query = query.filter(cls.target_id == str(target_id))
+        # 时间条件同时用于分区裁剪
+        if start:
+            query = query.filter(cls.created_at >= start)
+        if end:
+            query = query.filter(cls.created_at < end)
+        if before_id:
+            query = query.filter(cls.id < before_id)
+        return query.order_by(cls.id.desc()).limit(limit).all()
+
+    def to_dict(self):
+        """转换为字典格式"""
+        return {
+            'id': str(self.id),
+            'admin_id': self.admin_id,
+            'action': self.action,
+            'target_type': self.target_type,
+            'target_id': self.target_id,
+            'details': json.loads(self.details) if self.details else None,
+            'ip_address': self.ip_address,
+            'created_at': self.created_at.isoformat()
+        }
+
+    def __repr__(self):
+        return f'<AdminLog {self.action} by {self.admin_id}>'
+
+
+@event.listens_for(AdminLog.__table__, 'after_create')
+def create_initial_partitions(target, connection, **kw):
+    """建表（create_all）后创建初始分区，否则写入分区表会因找不到分区而失败"""
+    if connection.dialect.name != 'postgresql':
+        return
+
+    from app.controllers.audit import partition_statements
+    for _, statement in partition_statements(months_ahead=1):
+        connection.execute(text(statement))
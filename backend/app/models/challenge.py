@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目模型
+Author: sunsky
+功能：题目分类、题目信息、标签
+"""
+
+from datetime import datetime
+
+from app import db
+
+
+class Category(db.Model):
+    """题目分类模型（Web、Pwn、Reverse等）"""
+    __tablename__ = 'categories'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), nullable=False)
+    description = db.Column(db.String(255))
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    # 关联关系
+    challenges = db.relationship('Challenge', backref='category', lazy='dynamic')
+    
+    def to_dict(self):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'name': self.name,
+            'description': self.description
+        }
+    
+    def __repr__(self):
+        return f'<Category {self.name}>'
+
+
+class Challenge(db.Model):
+    """题目模型"""
+    __tablename__ = 'challenges'
+    
+    # 基础字段
+    id = db.Column(db.Integer, primary_key=True)
+    title = db.Column(db.String(200), nullable=False)
+    description = db.Column(db.Text)
+    category_id = db.Column(db.Integer, db.ForeignKey('categories.id'), index=True)
+    
+    # 分值与状态
+    points = db.Column(db.Integer, default=100, nullable=False)
+    is_visible = db.Column(db.Boolean, default=True, nullable=False)
+    
+    # 时间字段
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    
+    # 关联关系
+    submissions = db.relationship('Submission', backref='challenge', lazy='dynamic')
+    flags = db.relationship('Flag', backref='challenge', cascade='all, delete-orphan')
+    tags = db.relationship('Tag', secondary='challenge_tags', backref='challenges')
+    
+    def to_dict(self):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'category': self.category.name if self.category else None,
+            'points': self.points,
+            'tags': [tag.name for tag in self.tags],
+            'created_at': self.created_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<Challenge {self.title}>'
+
+
+class Tag(db.Model):
+    """题目标签模型"""
+    __tablename__ = 'tags'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    name = db.Column(db.String(50), unique=True, nullable=False)
+    
+    def __repr__(self):
+        return f'<Tag {self.name}>'
+
+
+class ChallengeTag(db.Model):
+    """题目与标签关联模型"""
+    __tablename__ = 'challenge_tags'
+    
+    challenge_id = db.Column(db.Integer, db.ForeignKey('challenges.id'), primary_key=True)
+    tag_id = db.Column(db.Integer, db.ForeignKey('tags.id'), primary_key=True)
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台通知模型
+Author: sunsky
+功能：个人通知、全站公告、已读游标
+说明：全站公告只存一行，不为每个用户复制；已读状态统一由用户的已读游标表示
+"""
+
+from datetime import datetime
+
+from app import db
+
+
+class Notification(db.Model):
+    """个人通知模型"""
+    __tablename__ = 'notifications'
+    __table_args__ = (
+        # 收件箱按 (user_id, id) 做键集分页
+        db.Index('ix_notifications_user_id_id', 'user_id', 'id'),
+    )
+
+    # 基础字段
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False)
+
+    # 通知内容
+    type = db.Column(db.String(20), default='system', nullable=False)
+    title = db.Column(db.String(200), nullable=False)
+    content = db.Column(db.Text)
+    link = db.Column(db.String(255))
+
+    # 时间字段
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self, last_read_id=0):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'type': self.type,
+            'title': self.title,
+            'content': self.content,
+            'link': self.link,
+            'is_read': self.id <= last_read_id,
+            'created_at': self.created_at.isoformat()
+        }
+
+    def __repr__(self):
+        return f'<Notification {self.title}>'
+
+
+class Announcement(db.Model):
+    """全站公告模型（读时扩散，每条公告只有一行）"""
+    __tablename__ = 'announcements'
+
+    # 基础字段
+    id = db.Column(db.Integer, primary_key=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+
+    # 公告内容
+    title = db.Column(db.String(200), nullable=False)
+    content = db.Column(db.Text, nullable=False)
+
+    # 状态字段
+    is_active = db.Column(db.Boolean, default=True, nullable=False, index=True)
+
+    # 时间字段
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+
+    def to_dict(self, last_read_id=0):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'content': self.content,
+            'is_read': self.id <= last_read_id,
+            'created_at': self.created_at.isoformat()
+        }
+
+    def __repr__(self):
+        return f'<Announcement {self.title}>'
+
+
+class NotificationCursor(db.Model):
+    """用户已读游标：ID不大于游标的通知/公告视为已读"""
+    __tablename__ = 'notification_cursors'
+
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), primary_key=True)
+    last_read_notification_id = db.Column(db.Integer, default=0, nullable=False)
+    last_read_announcement_id = db.Column(db.Integer, default=0, nullable=False)
+
+    # 时间字段
+    updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f'<NotificationCursor {self.user_id}>'
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台排行榜快照模型
+Author: sunsky
+功能：封榜时保存不可变的排行榜快照，赛后揭榜
+"""
+
+from datetime import datetime
+import json
+
+from app import db
+
+
+class ScoreboardSnapshot(db.Model):
+    """排行榜快照模型（封榜时写入一次，之后只读）"""
+    __tablename__ = 'scoreboard_snapshots'
+    __table_args__ = (
+        # 同一时刻最多一个生效快照（部分唯一索引，防止并发封榜产生多个快照）
+        db.Index(
+            'uq_scoreboard_snapshots_active', 'is_active', unique=True,
+            postgresql_where=db.text('is_active'),
+            sqlite_where=db.text('is_active')
+        ),
+    )
+
+    # 基础字段
+    id = db.Column(db.Integer, primary_key=True)
+    created_by = db.Column(db.Integer, db.ForeignKey('users.id'))
+
+    # 快照内容（JSON序列化的排行榜）
+    data = db.Column(db.Text, nullable=False)
+
+    # 状态字段：封榜期间为True，揭榜后置为False
+    is_active = db.Column(db.Boolean, default=True, nullable=False)
+
+    # 时间字段
+    frozen_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    revealed_at = db.Column(db.DateTime)
+
+    @classmethod
+    def get_active(cls):
+        """获取当前生效的封榜快照"""
+        return cls.query.filter_by(is_active=True).order_by(cls.frozen_at.desc()).first()
+
+    @classmethod
+    def get_latest(cls):
+        """获取最近一次封榜快照（含已揭榜的）"""
+        return cls.query.order_by(cls.frozen_at.desc()).first()
+
+    def get_entries(self):
+        """获取快照中的排行榜条目"""
+        return json.loads(self.data)
+
+    def to_dict(self, include_entries=True):
+        """转换为字典格式"""
+        data = {
+            'id': self.id,
+            'is_active': self.is_active,
+            'frozen_at': self.frozen_at.isoformat(),
+            'revealed_at': self.revealed_at.isoformat() if self.revealed_at else None
+        }
+        if include_entries:
+            data['entries'] = self.get_entries()
+        return data
+
+    def __repr__(self):
+        return f'<ScoreboardSnapshot {self.frozen_at}>'
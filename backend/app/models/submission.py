@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台提交模型
+Author: sunsky
+功能：flag提交记录、题目flag
+"""
+
+from datetime import datetime
+
+from app import db
+
+
+class Submission(db.Model):
+    """flag提交记录模型"""
+    __tablename__ = 'submissions'
+    __table_args__ = (
+        # 揭榜回放与解题统计按时间扫描正确提交
+        db.Index('ix_submissions_is_correct_created_at', 'is_correct', 'created_at'),
+    )
+    
+    # 基础字段
+    id = db.Column(db.Integer, primary_key=True)
+    user_id = db.Column(db.Integer, db.ForeignKey('users.id'), nullable=False, index=True)
+    challenge_id = db.Column(db.Integer, db.ForeignKey('challenges.id'), nullable=False, index=True)
+    
+    # 提交内容
+    flag = db.Column(db.String(255))
+    is_correct = db.Column(db.Boolean, default=False, nullable=False)
+    ip_address = db.Column(db.String(45))
+    
+    # 时间字段
+    created_at = db.Column(db.DateTime, default=datetime.utcnow, nullable=False)
+    
+    def to_dict(self):
+        """转换为字典格式"""
+        return {
+            'id': self.id,
+            'user_id': self.user_id,
+            'challenge_id': self.challenge_id,
+            'is_correct': self.is_correct,
+            'created_at': self.created_at.isoformat()
+        }
+    
+    def __repr__(self):
+        return f'<Submission {self.user_id}:{self.challenge_id}>'
+
+
+class Flag(db.Model):
+    """题目flag模型（一道题可有多个有效flag）"""
+    __tablename__ = 'flags'
+    
+    id = db.Column(db.Integer, primary_key=True)
+    challenge_id = db.Column(db.Integer, db.ForeignKey('challenges.id'), nullable=False, index=True)
+    content = db.Column(db.String(255), nullable=False)
+    is_regex = db.Column(db.Boolean, default=False, nullable=False)
+    
+    def __repr__(self):
+        return f'<Flag {self.challenge_id}>'
@@ -9,12 +9,11 @@ TODO: 添加OAuth第三方登录支持
 
 from datetime import datetime, timedelta
 from werkzeug.security import generate_password_hash, check_password_hash
-from flask_sqlalchemy import SQLAlchemy
 from flask_jwt_extended import create_access_token, create_refresh_token
 import secrets
 import string
 
-db = SQLAlchemy()
+from app import db
 
 
 class User(db.Model):
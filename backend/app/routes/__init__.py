@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台API路由包
+Author: sunsky
+功能：各功能模块的蓝图定义
+"""
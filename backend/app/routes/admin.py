@@ -0,0 +1,59 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台管理员路由
+Author: sunsky
+功能：审计日志查询
+"""
+
+from datetime import datetime
+
+from flask import Blueprint, current_app, jsonify, request
+
+from app.controllers.audit import query_logs
+from app.utils.auth import admin_required
+
+admin_bp = Blueprint('admin', __name__)
+
+
+def _parse_time(name):
+    """解析ISO格式时间参数，格式错误返回False"""
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        return False
+
+
+@admin_bp.route('/logs', methods=['GET'])
+@admin_required
+def admin_logs():
+    """
+    审计日志查询
+    参数：admin_id、target_type、target_id、start、end（ISO时间）、before_id、limit
+    """
+    start, end = _parse_time('start'), _parse_time('end')
+    if start is False or end is False:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': '时间格式错误，应为ISO格式',
+            'code': 400
+        }), 400
+
+    per_page = current_app.config['AUDIT_LOGS_PER_PAGE']
+    limit = max(1, min(request.args.get('limit', per_page, type=int), per_page * 4))
+    items, next_before_id = query_logs(
+        admin_id=request.args.get('admin_id', type=int),
+        target_type=request.args.get('target_type'),
+        target_id=request.args.get('target_id'),
+        start=start,
+        end=end,
+        before_id=request.args.get('before_id', type=int),
+        limit=limit
+    )
+    return jsonify({
+        'items': items,
+        'next_before_id': next_before_id
+    })
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例路由
+Author: sunsky
+功能：队伍申请/释放题目独立实例，管理员查看实例池统计与强制释放
+"""
+
+from flask import Blueprint, jsonify
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from app import db
+from app.instances import instance_manager
+from app.models import User
+from app.utils.auth import admin_required
+
+instance_bp = Blueprint('instance', __name__)
+
+
+@instance_bp.before_request
+def require_manager():
+    """实例管理器只在开启 INSTANCE_MANAGER_ENABLED 的进程中运行"""
+    if instance_manager.app is None:
+        return jsonify({
+            'error': 'Service Unavailable',
+            'message': '题目实例服务未在当前节点启用',
+            'code': 503
+        }), 503
+
+
+def _current_team_id():
+    """获取当前用户所在队伍ID"""
+    user = db.session.get(User, get_jwt_identity())
+    team = user.get_team() if user else None
+    return team.id if team else None
+
+
+@instance_bp.route('/', methods=['GET'])
+@jwt_required()
+def list_instances():
+    """当前队伍持有的实例"""
+    team_id = _current_team_id()
+    if team_id is None:
+        return jsonify({'items': []})
+    return jsonify({
+        'items': [instance.to_dict() for instance in instance_manager.get_team_instances(team_id)]
+    })
+
+
+@instance_bp.route('/<challenge_id>', methods=['POST'])
+@jwt_required()
+def acquire_instance(challenge_id):
+    """为当前队伍申请题目实例（已持有时返回现有实例）"""
+    team_id = _current_team_id()
+    if team_id is None:
+        return jsonify({
+            'error': 'Forbidden',
+            'message': '请先加入队伍',
+            'code': 403
+        }), 403
+
+    if challenge_id not in instance_manager.pools:
+        return jsonify({
+            'error': 'Not Found',
+            'message': '该题目不需要独立实例',
+            'code': 404
+        }), 404
+
+    instance, error = instance_manager.acquire(challenge_id, team_id)
+    if error:
+        return jsonify({
+            'error': 'Conflict',
+            'message': error,
+            'code': 409
+        }), 409
+    return jsonify(instance.to_dict()), 201
+
+
+@instance_bp.route('/<instance_id>', methods=['DELETE'])
+@jwt_required()
+def release_instance(instance_id):
+    """释放当前队伍的实例"""
+    team_id = _current_team_id()
+    if team_id is None:
+        return jsonify({
+            'error': 'Forbidden',
+            'message': '请先加入队伍',
+            'code': 403
+        }), 403
+
+    if not instance_manager.release(instance_id, team_id):
+        return jsonify({
+            'error': 'Not Found',
+            'message': '实例不存在',
+            'code': 404
+        }), 404
+    return jsonify({'message': '实例已释放'})
+
+
+@instance_bp.route('/admin/<instance_id>', methods=['DELETE'])
+@admin_required
+def force_release_instance(instance_id):
+    """强制释放任意实例（管理员）"""
+    if not instance_manager.force_release(instance_id):
+        return jsonify({
+            'error': 'Not Found',
+            'message': '实例不存在',
+            'code': 404
+        }), 404
+    return jsonify({'message': '实例已释放'})
+
+
+@instance_bp.route('/metrics', methods=['GET'])
+@admin_required
+def instance_metrics():
+    """实例池统计：命中率、就绪耗时、各池水位（管理员）"""
+    return jsonify(instance_manager.get_metrics())
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台通知路由
+Author: sunsky
+功能：未读计数、收件箱、全站公告、管理员批量发送
+"""
+
+from flask import Blueprint, current_app, jsonify, request
+from flask_jwt_extended import get_jwt_identity, jwt_required
+
+from app.controllers.notification import (
+    get_announcements, get_inbox, get_unread_count, mark_all_read,
+    publish_announcement, send_notifications, withdraw_announcement
+)
+from app.models import User
+from app.utils.auth import admin_required
+
+notification_bp = Blueprint('notification', __name__)
+
+
+def _page_args():
+    """解析键集分页参数"""
+    per_page = current_app.config['NOTIFICATIONS_PER_PAGE']
+    limit = min(request.args.get('limit', per_page, type=int), per_page * 5)
+    return request.args.get('before_id', type=int), max(limit, 1)
+
+
+@notification_bp.route('/unread-count', methods=['GET'])
+@jwt_required()
+def unread_count():
+    """未读数量（用于页面角标）"""
+    return jsonify(get_unread_count(get_jwt_identity()))
+
+
+@notification_bp.route('/', methods=['GET'])
+@jwt_required()
+def inbox():
+    """个人通知收件箱，?before_id= 翻页"""
+    before_id, limit = _page_args()
+    items, next_before_id = get_inbox(get_jwt_identity(), before_id, limit)
+    return jsonify({
+        'items': items,
+        'next_before_id': next_before_id
+    })
+
+
+@notification_bp.route('/announcements', methods=['GET'])
+@jwt_required()
+def announcements():
+    """全站公告列表，?before_id= 翻页"""
+    before_id, limit = _page_args()
+    items, next_before_id = get_announcements(get_jwt_identity(), before_id, limit)
+    return jsonify({
+        'items': items,
+        'next_before_id': next_before_id
+    })
+
+
+@notification_bp.route('/read-all', methods=['POST'])
+@jwt_required()
+def read_all():
+    """全部标记为已读"""
+    mark_all_read(get_jwt_identity())
+    return jsonify({'message': '已全部标记为已读'})
+
+
+@notification_bp.route('/announcements', methods=['POST'])
+@admin_required
+def create_announcement():
+    """发布全站公告（管理员）"""
+    data = request.get_json(silent=True) or {}
+    if not data.get('title') or not data.get('content'):
+        return jsonify({
+            'error': 'Bad Request',
+            'message': '公告标题和内容不能为空',
+            'code': 400
+        }), 400
+
+    announcement = publish_announcement(data['title'], data['content'], get_jwt_identity())
+    return jsonify(announcement.to_dict()), 201
+
+
+@notification_bp.route('/announcements/<int:announcement_id>', methods=['DELETE'])
+@admin_required
+def delete_announcement(announcement_id):
+    """撤回全站公告（管理员）"""
+    if not withdraw_announcement(announcement_id):
+        return jsonify({
+            'error': 'Not Found',
+            'message': '公告不存在',
+            'code': 404
+        }), 404
+    return jsonify({'message': '公告已撤回'})
+
+
+@notification_bp.route('/send', methods=['POST'])
+@admin_required
+def send():
+    """向指定用户批量发送个人通知（管理员）"""
+    data = request.get_json(silent=True) or {}
+    user_ids = data.get('user_ids')
+    if not user_ids or not isinstance(user_ids, list) or not data.get('title'):
+        return jsonify({
+            'error': 'Bad Request',
+            'message': '接收用户和通知标题不能为空',
+            'code': 400
+        }), 400
+
+    try:
+        user_ids = {int(user_id) for user_id in user_ids}
+    except (TypeError, ValueError):
+        return jsonify({
+            'error': 'Bad Request',
+            'message': '接收用户ID必须为整数',
+            'code': 400
+        }), 400
+
+    # 只向存在的用户发送
+    user_ids = [
+        row[0] for row in User.query.with_entities(User.id)
+        .filter(User.id.in_(user_ids)).order_by(User.id).all()
+    ]
+    if not user_ids:
+        return jsonify({
+            'error': 'Bad Request',
+            'message': '接收用户不存在',
+            'code': 400
+        }), 400
+
+    count = send_notifications(
+        user_ids, data['title'],
+        content=data.get('content'),
+        type=data.get('type', 'system'),
+        link=data.get('link')
+    )
+    return jsonify({'count': count}), 201
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台排行榜路由
+Author: sunsky
+功能：排行榜查询、封榜、揭榜及揭榜事件流
+"""
+
+import json
+import time
+
+from flask import Blueprint, Response, current_app, jsonify, request, stream_with_context
+from flask_jwt_extended import get_jwt_identity
+
+from app import cache
+from app.controllers.scoreboard import (
+    freeze_scoreboard, get_active_snapshot_id, get_live_scoreboard,
+    get_reveal_events, get_snapshot_payload, reveal_scoreboard
+)
+from app.models import ScoreboardSnapshot
+from app.utils.auth import admin_required, is_admin_request
+
+ranking_bp = Blueprint('ranking', __name__)
+
+# 公开实时排行榜缓存键
+LIVE_SCOREBOARD_KEY = 'scoreboard:live'
+
+# 管理员预览揭榜时可设置的最大推送间隔（秒）
+MAX_REVEAL_INTERVAL = 5.0
+
+
+@ranking_bp.route('/scoreboard', methods=['GET'])
+def scoreboard():
+    """
+    排行榜
+    封榜期间普通用户读取封榜快照，管理员可通过 ?live=1 查看实时排行榜
+    """
+    live = request.args.get('live', type=int) == 1 and is_admin_request()
+    snapshot_id = None if live else get_active_snapshot_id()
+
+    # 快照记录不存在时（如被手动删除）回退到实时排行榜
+    payload = get_snapshot_payload(snapshot_id) if snapshot_id else None
+    if payload is not None:
+        response = jsonify({
+            'frozen': True,
+            'snapshot_id': snapshot_id,
+            'frozen_at': payload['frozen_at'],
+            'entries': payload['entries']
+        })
+        # 快照不可变，同一快照的ETag永远有效
+        response.set_etag(f'snapshot-{snapshot_id}')
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+
+    if live:
+        entries = get_live_scoreboard()
+    else:
+        entries = cache.get(LIVE_SCOREBOARD_KEY)
+        if entries is None:
+            entries = get_live_scoreboard(current_app.config['SCOREBOARD_SIZE'])
+            cache.set(
+                LIVE_SCOREBOARD_KEY, entries,
+                timeout=current_app.config['SCOREBOARD_CACHE_TIMEOUT']
+            )
+
+    return jsonify({
+        'frozen': False,
+        'entries': entries
+    })
+
+
+@ranking_bp.route('/scoreboard/snapshots/<int:snapshot_id>', methods=['GET'])
+def scoreboard_snapshot(snapshot_id):
+    """按ID读取封榜快照（内容不可变，允许永久缓存）"""
+    payload = get_snapshot_payload(snapshot_id)
+    if payload is None:
+        return jsonify({
+            'error': 'Not Found',
+            'message': '快照不存在',
+            'code': 404
+        }), 404
+
+    response = jsonify(payload)
+    response.cache_control.public = True
+    response.cache_control.max_age = 31536000
+    response.cache_control.immutable = True
+    return response
+
+
+@ranking_bp.route('/freeze', methods=['POST'])
+@admin_required
+def freeze():
+    """封榜（管理员）"""
+    snapshot, error = freeze_scoreboard(get_jwt_identity())
+    if error:
+        return jsonify({
+            'error': 'Conflict',
+            'message': error,
+            'code': 409
+        }), 409
+
+    return jsonify(snapshot.to_dict(include_entries=False)), 201
+
+
+@ranking_bp.route('/reveal', methods=['POST'])
+@admin_required
+def reveal():
+    """揭榜（管理员）：结束封榜，公开排行榜恢复实时数据"""
+    snapshot, error = reveal_scoreboard()
+    if error:
+        return jsonify({
+            'error': 'Conflict',
+            'message': error,
+            'code': 409
+        }), 409
+
+    cache.delete(LIVE_SCOREBOARD_KEY)
+    return jsonify(snapshot.to_dict(include_entries=False))
+
+
+def _get_reveal_snapshot():
+    """获取可揭榜的快照：揭榜后对所有人开放，揭榜前仅管理员可预览"""
+    snapshot = ScoreboardSnapshot.get_latest()
+    if not snapshot or (snapshot.is_active and not is_admin_request()):
+        return None
+    return snapshot
+
+
+@ranking_bp.route('/reveal/events', methods=['GET'])
+def reveal_events():
+    """揭榜事件列表（一次性返回，由前端自行播放动画，不占用连接）"""
+    snapshot = _get_reveal_snapshot()
+    if not snapshot:
+        return jsonify({
+            'error': 'Not Found',
+            'message': '暂无可揭榜的数据',
+            'code': 404
+        }), 404
+
+    response = jsonify({
+        'snapshot': snapshot.to_dict(include_entries=False),
+        'events': get_reveal_events(snapshot)
+    })
+    if not snapshot.is_active:
+        response.set_etag(f'reveal-{snapshot.id}')
+        response.cache_control.public = True
+        response.cache_control.no_cache = True
+        return response.make_conditional(request)
+    return response
+
+
+@ranking_bp.route('/reveal/stream', methods=['GET'])
+def reveal_stream():
+    """
+    揭榜事件流（Server-Sent Events）
+    按时间顺序推送封榜期间的解题事件，前端据此播放揭榜动画；
+    推送间隔固定为 SCOREBOARD_REVEAL_INTERVAL，仅管理员可通过 ?interval= 调整
+    """
+    snapshot = _get_reveal_snapshot()
+    if not snapshot:
+        return jsonify({
+            'error': 'Not Found',
+            'message': '暂无可揭榜的数据',
+            'code': 404
+        }), 404
+
+    interval = current_app.config['SCOREBOARD_REVEAL_INTERVAL']
+    if is_admin_request():
+        interval = request.args.get('interval', interval, type=float)
+        interval = min(max(interval, 0.0), MAX_REVEAL_INTERVAL)
+    events = get_reveal_events(snapshot)
+
+    def generate():
+        yield f"event: start\ndata: {json.dumps(snapshot.to_dict(), ensure_ascii=False)}\n\n"
+        for event in events:
+            yield f"event: solve\ndata: {json.dumps(event, ensure_ascii=False)}\n\n"
+            if interval > 0:
+                time.sleep(interval)
+        yield 'event: end\ndata: {}\n\n'
+
+    return Response(
+        stream_with_context(generate()),
+        mimetype='text/event-stream',
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'}
+    )
@@ -0,0 +1,7 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台工具包
+Author: sunsky
+功能：通用工具函数与装饰器
+"""
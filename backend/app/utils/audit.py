@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台审计日志缓冲写入
+Author: sunsky
+功能：管理员操作日志先进入进程内队列，由后台线程批量写库，不占用请求事务
+说明：
+    每个工作进程一个队列和一个写入线程（fork后首次写日志时启动）；
+    进程正常退出（包括gunicorn收到SIGTERM的优雅关闭）时通过atexit写完队列中剩余日志；
+    队列满时由调用方同步写入，宁可变慢也不丢日志
+"""
+
+import atexit
+from datetime import datetime
+import json
+import os
+import queue
+import tempfile
+import threading
+import time
+
+from flask import has_request_context, request
+from sqlalchemy import insert
+
+# 时间递增ID：毫秒时间戳(41位) | 节点号(16位) | 序号(6位)
+# 节点号 = 主机号(6位，AUDIT_LOG_NODE_ID，多主机/多容器部署时每台配置不同值) | 本机进程槽位(10位)
+_EPOCH_MS = 1735689600000  # 2025-01-01 UTC
+HOST_BITS = 6
+SLOT_BITS = 10
+SEQUENCE_BITS = 6
+_SEQUENCE_MASK = (1 << SEQUENCE_BITS) - 1
+_SLOT_MASK = (1 << SLOT_BITS) - 1
+
+_id_lock = threading.Lock()
+_last_ms = 0
+_sequence = 0
+_host_id = 0
+_node = None  # (进程号, 节点号, 槽位锁文件)
+
+
+def configure_node(host_id):
+    """设置本机主机号（0 ~ 63）"""
+    global _host_id, _node
+    if not 0 <= host_id < (1 << HOST_BITS):
+        raise ValueError(f'AUDIT_LOG_NODE_ID 必须在 0 ~ {(1 << HOST_BITS) - 1} 之间')
+    with _id_lock:
+        _host_id = host_id
+        _node = None
+
+
+def _claim_slot():
+    """
+    为当前进程占用一个本机唯一的槽位
+    通过文件锁实现，进程退出时自动释放；不支持 fcntl 的系统（Windows开发环境）退化为进程号低位
+    Returns:
+        (槽位, 持有锁的文件对象)
+    """
+    try:
+        import fcntl
+    except ImportError:
+        return os.getpid() & _SLOT_MASK, None
+
+    directory = os.path.join(tempfile.gettempdir(), 'qhuctf-audit-slots')
+    os.makedirs(directory, exist_ok=True)
+    for slot in range(_SLOT_MASK + 1):
+        lock_file = open(os.path.join(directory, f'{slot}.lock'), 'w')
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except OSError:
+            lock_file.close()
+            continue
+        return slot, lock_file
+    return os.getpid() & _SLOT_MASK, None
+
+
+def _node_id():
+    """当前进程的节点号（fork后的子进程重新占用槽位），调用方需持有 _id_lock"""
+    global _node
+    if _node is None or _node[0] != os.getpid():
+        slot, lock_file = _claim_slot()
+        _node = (os.getpid(), (_host_id << SLOT_BITS) | slot, lock_file)
+    return _node[1]
+
+
+def generate_log_id():
+    """生成按时间递增、跨主机与进程唯一的日志ID"""
+    global _last_ms, _sequence
+    with _id_lock:
+        node = _node_id()
+        now_ms = int(time.time() * 1000)
+        if now_ms <= _last_ms:
+            _sequence = (_sequence + 1) & _SEQUENCE_MASK
+            if _sequence == 0:
+                _last_ms += 1
+            now_ms = _last_ms
+        else:
+            _sequence = 0
+        _last_ms = now_ms
+        return ((now_ms - _EPOCH_MS) << (HOST_BITS + SLOT_BITS + SEQUENCE_BITS)) | \
+            (node << SEQUENCE_BITS) | _sequence
+
+
+class AuditLogBuffer:
+    """审计日志缓冲队列"""
+
+    def __init__(self, app=None):
+        self.app = None
+        self._queue = None
+        self._thread = None
+        self._pid = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        """初始化（读取批量大小、刷新间隔、队列容量配置）"""
+        self.app = app
+        self.batch_size = app.config.get('AUDIT_LOG_BATCH_SIZE', 200)
+        self.flush_interval = app.config.get('AUDIT_LOG_FLUSH_INTERVAL', 2.0)
+        self.queue_size = app.config.get('AUDIT_LOG_QUEUE_SIZE', 10000)
+        # 测试环境同步写入，便于断言
+        self.synchronous = app.config.get('AUDIT_LOG_SYNCHRONOUS', False)
+        configure_node(app.config.get('AUDIT_LOG_NODE_ID', 0))
+        atexit.register(self.shutdown)
+
+    def _ensure_worker(self):
+        """按进程启动写入线程（fork后的子进程需要重新创建队列和线程）"""
+        if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._pid == os.getpid() and self._thread and self._thread.is_alive():
+                return
+            self._pid = os.getpid()
+            self._queue = queue.Queue(maxsize=self.queue_size)
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name='audit-log-writer', daemon=True)
+            self._thread.start()
+
+    def log(self, admin_id, action, target_type=None, target_id=None, details=None, ip_address=None):
+        """
+        记录一条管理员操作日志（立即返回，由后台线程写库）
+        Args:
+            admin_id: 操作者ID
+            action: 操作名称，如 'ban_user'、'update_challenge'
+            target_type: 操作对象类型
+            target_id: 操作对象ID
+            details: 附加信息（可JSON序列化的对象）
+            ip_address: 操作者IP，请求上下文中默认取 request.remote_addr
+        Returns:
+            日志ID
+        """
+        if ip_address is None and has_request_context():
+            ip_address = request.remote_addr
+
+        entry = {
+            'id': generate_log_id(),
+            'created_at': datetime.utcnow(),
+            'admin_id': admin_id,
+            'action': action,
+            'target_type': target_type,
+            'target_id': str(target_id) if target_id is not None else None,
+            'details': json.dumps(details, ensure_ascii=False) if details is not None else None,
+            'ip_address': ip_address
+        }
+
+        if self.synchronous:
+            self._write([entry])
+            return entry['id']
+
+        self._ensure_worker()
+        try:
+            self._queue.put_nowait(entry)
+        except queue.Full:
+            # 队列已满：调用方同步写入，保证不丢日志
+            self._write([entry])
+        return entry['id']
+
+    def log_many(self, admin_id, action, target_type, target_ids, details=None):
+        """批量记录同一操作（如批量封禁账号）"""
+        return [
+            self.log(admin_id, action, target_type, target_id, details)
+            for target_id in target_ids
+        ]
+
+    def _drain(self, batch, timeout):
+        """从队列中取出日志直到凑满一批或超时"""
+        deadline = time.monotonic() + timeout
+        while len(batch) < self.batch_size:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(self._queue.get(timeout=remaining))
+            except queue.Empty:
+                break
+        return batch
+
+    def _run(self):
+        """后台写入线程"""
+        while not self._stop.is_set():
+            batch = self._drain([], self.flush_interval)
+            if batch:
+                self._write(batch)
+
+    def _write(self, batch, retries=3):
+        """批量写库，失败重试，仍失败则写入应用日志兜底"""
+        from app import db
+        from app.models import AdminLog
+
+        for attempt in range(retries):
+            with self.app.app_context():
+                try:
+                    db.session.execute(insert(AdminLog), batch)
+                    db.session.commit()
+                    return
+                except Exception as e:
+                    db.session.rollback()
+                    error = e
+            if attempt == retries - 1:
+                self.app.logger.error(
+                    '审计日志写入失败(%s)，共%d条: %s', error, len(batch),
+                    json.dumps(batch, default=str, ensure_ascii=False)
+                )
+            else:
+                time.sleep(0.1 * (attempt + 1))
+
+    def flush(self):
+        """同步写入当前队列中的全部日志"""
+        if self._queue is None or self._pid != os.getpid():
+            return
+        while True:
+            batch = []
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            if not batch:
+                return
+            self._write(batch)
+
+    def shutdown(self, timeout=5.0):
+        """优雅关闭：停止后台线程并写完剩余日志"""
+        self._stop.set()
+        if self._thread and self._pid == os.getpid():
+            self._thread.join(timeout)
+        self.flush()
+
+
+# 全局审计日志实例
+audit_log = AuditLogBuffer()
@@ -0,0 +1,33 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台权限工具
+Author: sunsky
+功能：基于JWT声明的管理员权限校验
+"""
+
+from functools import wraps
+
+from flask import jsonify
+from flask_jwt_extended import get_jwt, verify_jwt_in_request
+
+
+def is_admin_request():
+    """判断当前请求是否携带管理员令牌（未登录视为非管理员）"""
+    verify_jwt_in_request(optional=True)
+    return bool(get_jwt().get('is_admin'))
+
+
+def admin_required(fn):
+    """管理员权限装饰器"""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        verify_jwt_in_request()
+        if not get_jwt().get('is_admin'):
+            return jsonify({
+                'error': 'Forbidden',
+                'message': '权限不足',
+                'code': 403
+            }), 403
+        return fn(*args, **kwargs)
+    return wrapper
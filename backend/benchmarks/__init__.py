@@ -0,0 +1,15 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台性能基准测试包
+Author: sunsky
+功能：批量造数、竞赛生命周期压测回放、延迟/吞吐/SQL次数统计与基线对比
+"""
+
+from .metrics import EndpointStats, QueryCounter, Recorder, percentile
+from .baseline import compare_with_baseline, load_baseline, save_baseline
+
+__all__ = [
+    'EndpointStats', 'QueryCounter', 'Recorder', 'percentile',
+    'compare_with_baseline', 'load_baseline', 'save_baseline'
+]
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试基线管理
+Author: sunsky
+功能：保存/加载基线结果，并与本次结果对比找出性能回退
+"""
+
+import json
+import os
+
+# 默认允许的延迟/吞吐波动比例
+DEFAULT_TOLERANCE = 0.2
+
+
+def save_baseline(report, path):
+    """保存基线结果"""
+    directory = os.path.dirname(path)
+    if directory and not os.path.exists(directory):
+        os.makedirs(directory)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2, sort_keys=True)
+
+
+def load_baseline(path):
+    """加载基线结果，文件不存在时返回None"""
+    if not os.path.exists(path):
+        return None
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+
+def compare_with_baseline(report, baseline, tolerance=DEFAULT_TOLERANCE):
+    """
+    对比本次结果与基线
+    Args:
+        report: 本次报告 {接口名: 指标字典}
+        baseline: 基线报告，结构相同
+        tolerance: 延迟、吞吐量允许的波动比例
+    Returns:
+        回退项列表，每项为 (接口名, 指标名, 基线值, 当前值)
+    说明：
+        SQL次数是确定性的，只要增加即视为回退；
+        延迟与吞吐量受机器负载影响，超出容忍比例才视为回退
+    """
+    regressions = []
+    for name, current in report.items():
+        base = baseline.get(name)
+        if not base:
+            continue
+
+        for key in ('p50_ms', 'p99_ms'):
+            if base[key] and current[key] > base[key] * (1 + tolerance):
+                regressions.append((name, key, base[key], current[key]))
+
+        if base['throughput_rps'] and \
+           current['throughput_rps'] < base['throughput_rps'] * (1 - tolerance):
+            regressions.append((name, 'throughput_rps', base['throughput_rps'], current['throughput_rps']))
+
+        if current['queries_per_request'] > base['queries_per_request']:
+            regressions.append((
+                name, 'queries_per_request',
+                base['queries_per_request'], current['queries_per_request']
+            ))
+
+        if current['errors'] > base['errors']:
+            regressions.append((name, 'errors', base['errors'], current['errors']))
+
+    return regressions
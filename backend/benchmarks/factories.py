@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试数据工厂
+Author: sunsky
+功能：基于factory-boy构造用户、团队、题目、提交等测试数据
+"""
+
+import random
+
+import factory
+from werkzeug.security import generate_password_hash
+
+from app.models import (
+    User, UserProfile, Challenge, Category, Submission, Team, TeamMember
+)
+
+# 压测账号统一密码，登录风暴阶段使用
+BENCH_PASSWORD = 'bench-password'
+
+# 压测管理员账号，封榜阶段使用
+BENCH_ADMIN = 'bench_admin'
+
+# 密码哈希计算代价很高，造数时所有账号共用同一个哈希值
+_BENCH_PASSWORD_HASH = None
+
+
+def bench_password_hash():
+    """获取压测账号的密码哈希（惰性计算一次）"""
+    global _BENCH_PASSWORD_HASH
+    if _BENCH_PASSWORD_HASH is None:
+        _BENCH_PASSWORD_HASH = generate_password_hash(BENCH_PASSWORD)
+    return _BENCH_PASSWORD_HASH
+
+
+class BaseFactory(factory.Factory):
+    """基础工厂：只构造对象，不绑定会话，由造数脚本批量写入"""
+
+    class Meta:
+        abstract = True
+
+
+class UserFactory(BaseFactory):
+    """用户工厂"""
+
+    class Meta:
+        model = User
+
+    username = factory.Sequence(lambda n: f'bench_user_{n}')
+    email = factory.LazyAttribute(lambda o: f'{o.username}@bench.local')
+
+    @classmethod
+    def _create(cls, model_class, username, email, **kwargs):
+        # User.__init__ 只接收 username/email/password，其余字段构造后赋值
+        user = model_class(username=username, email=email)
+        user.password_hash = bench_password_hash()
+        user.is_active = True
+        user.is_verified = True
+        for key, value in kwargs.items():
+            setattr(user, key, value)
+        return user
+
+    _build = _create
+
+
+class UserProfileFactory(BaseFactory):
+    """用户资料工厂"""
+
+    class Meta:
+        model = UserProfile
+
+    nickname = factory.Sequence(lambda n: f'选手{n}')
+    school = '青海大学'
+    total_score = 0
+    solved_count = 0
+    submission_count = 0
+
+
+class CategoryFactory(BaseFactory):
+    """题目分类工厂"""
+
+    class Meta:
+        model = Category
+
+    name = factory.Iterator(['Web', 'Pwn', 'Reverse', 'Crypto', 'Misc', 'Forensics'])
+
+
+class ChallengeFactory(BaseFactory):
+    """题目工厂"""
+
+    class Meta:
+        model = Challenge
+
+    title = factory.Sequence(lambda n: f'bench-challenge-{n:04d}')
+    description = factory.Faker('paragraph', nb_sentences=4)
+    points = factory.LazyFunction(lambda: random.choice([100, 200, 300, 500]))
+
+
+class TeamFactory(BaseFactory):
+    """团队工厂"""
+
+    class Meta:
+        model = Team
+
+    name = factory.Sequence(lambda n: f'bench_team_{n}')
+
+
+class TeamMemberFactory(BaseFactory):
+    """团队成员工厂"""
+
+    class Meta:
+        model = TeamMember
+
+    is_active = True
+
+
+class SubmissionFactory(BaseFactory):
+    """提交记录工厂（默认约30%为正确提交）"""
+
+    class Meta:
+        model = Submission
+
+    is_correct = factory.LazyFunction(lambda: random.random() < 0.3)
@@ -0,0 +1,250 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台竞赛生命周期压测场景
+Author: sunsky
+功能：按比赛时间线回放流量——注册风暴、开赛登录风暴、放题尖峰、排行榜轮询、赛末封榜
+"""
+
+import random
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from werkzeug.exceptions import MethodNotAllowed, NotFound
+
+from app.models import User, Challenge, ScoreboardSnapshot
+
+from .factories import BENCH_ADMIN, BENCH_PASSWORD
+
+# 错误的flag，放题尖峰阶段模拟选手的试错提交
+WRONG_FLAG = 'flag{bench_wrong_answer}'
+
+
+class BenchmarkError(RuntimeError):
+    """压测前置条件不满足（如封榜失败），继续运行得到的数据没有意义"""
+
+
+class Call:
+    """一次待回放的HTTP请求"""
+
+    def __init__(self, endpoint, method, url, token=None, json=None):
+        self.endpoint = endpoint
+        self.method = method
+        self.url = url
+        self.token = token
+        self.json = json
+
+    def send(self, client):
+        headers = {'Authorization': f'Bearer {self.token}'} if self.token else {}
+        return client.open(self.url, method=self.method, headers=headers, json=self.json)
+
+
+class LifecycleContext:
+    """阶段之间共享的状态（令牌、题目ID、跳过的阶段等）"""
+
+    def __init__(self, app, scale_factor=1.0):
+        self.app = app
+        self.scale_factor = scale_factor
+        self.tokens = []
+        self.skipped = {}
+        # 每次运行的唯一后缀，--skip-seed 复用数据时注册用户名不会与上次冲突
+        self.run_id = uuid.uuid4().hex[:8]
+        with app.app_context():
+            self.usernames = [
+                row[0] for row in User.query.with_entities(User.username)
+                .filter(User.is_admin.is_(False)).all()
+            ]
+            self.challenge_ids = [row[0] for row in Challenge.query.with_entities(Challenge.id).all()]
+            # 管理员令牌直接签发，封榜/揭榜不依赖登录接口
+            admin = User.query.filter_by(username=BENCH_ADMIN).first()
+            self.admin_token = admin.generate_tokens()[0] if admin else None
+
+    def size(self, base):
+        """按缩放系数计算请求数"""
+        return max(1, int(base * self.scale_factor))
+
+    def random_token(self):
+        return random.choice(self.tokens) if self.tokens else None
+
+
+def _extract_token(response):
+    """从登录响应中取出访问令牌"""
+    data = response.get_json(silent=True) or {}
+    return data.get('access_token') or (data.get('data') or {}).get('access_token')
+
+
+def registration_storm(ctx):
+    """注册风暴：报名截止前大量新用户注册"""
+    return [
+        Call('POST /api/auth/register', 'POST', '/api/auth/register', json={
+            'username': f'bench_reg_{ctx.run_id}_{index}',
+            'email': f'bench_reg_{ctx.run_id}_{index}@bench.local',
+            'password': BENCH_PASSWORD
+        })
+        for index in range(ctx.size(500))
+    ]
+
+
+def login_storm(ctx):
+    """开赛登录风暴：开赛瞬间大量已注册选手同时登录"""
+    usernames = ctx.usernames[:ctx.size(1000)]
+    return [
+        Call('POST /api/auth/login', 'POST', '/api/auth/login', json={
+            'username': username,
+            'password': BENCH_PASSWORD
+        })
+        for username in usernames
+    ]
+
+
+def release_spike(ctx):
+    """放题尖峰：新题发布后选手集中刷新题目列表、打开题目并提交"""
+    calls = []
+    for _ in range(ctx.size(1500)):
+        challenge_id = random.choice(ctx.challenge_ids)
+        token = ctx.random_token()
+        calls.append(Call('GET /api/challenge/', 'GET', '/api/challenge/', token=token))
+        calls.append(Call(
+            'GET /api/challenge/<id>', 'GET', f'/api/challenge/{challenge_id}', token=token
+        ))
+        calls.append(Call(
+            'POST /api/challenge/<id>/submit', 'POST', f'/api/challenge/{challenge_id}/submit',
+            token=token, json={'flag': WRONG_FLAG}
+        ))
+    return calls
+
+
+def scoreboard_polling(ctx):
+    """排行榜轮询：比赛进行中前端定时刷新排行榜"""
+    return [
+        Call('GET /api/ranking/scoreboard', 'GET', '/api/ranking/scoreboard', token=ctx.random_token())
+        for _ in range(ctx.size(3000))
+    ]
+
+
+def freeze_setup(ctx):
+    """赛末封榜：管理员执行封榜"""
+    return Call('POST /api/ranking/freeze', 'POST', '/api/ranking/freeze', token=ctx.admin_token)
+
+
+# 生命周期阶段：(阶段名, 请求构造函数, 并发数)
+PHASES = [
+    ('registration', registration_storm, 16),
+    ('login', login_storm, 32),
+    ('release', release_spike, 32),
+    ('polling', scoreboard_polling, 32),
+    ('freeze', scoreboard_polling, 32),
+]
+
+
+def _missing_endpoints(app, calls):
+    """找出当前应用中不存在的接口（对应的阶段无法回放）"""
+    adapter = app.url_map.bind('localhost')
+    missing = set()
+    for call in calls:
+        try:
+            adapter.match(call.url, method=call.method)
+        except (NotFound, MethodNotAllowed):
+            missing.add(call.endpoint)
+    return sorted(missing)
+
+
+def _run_calls(app, recorder, phase, calls, concurrency):
+    """并发回放请求，每个工作线程使用独立的测试客户端"""
+    chunks = [calls[index::concurrency] for index in range(concurrency)]
+    responses = []
+
+    def worker(chunk):
+        client = app.test_client()
+        results = []
+        for call in chunk:
+            response = recorder.measure(
+                f'[{phase}] {call.endpoint}',
+                lambda: call.send(client)
+            )
+            results.append((call, response))
+        return results
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for results in pool.map(worker, [chunk for chunk in chunks if chunk]):
+            responses.extend(results)
+    elapsed = time.perf_counter() - started
+
+    recorder.add_elapsed({f'[{phase}] {call.endpoint}' for call in calls}, elapsed)
+    return responses
+
+
+def _run_freeze_setup(ctx, recorder):
+    """执行封榜，封榜失败时中止压测（否则 freeze 阶段测到的是实时排行榜）"""
+    if not ctx.admin_token:
+        raise BenchmarkError(f'未找到压测管理员 {BENCH_ADMIN}，请先造数')
+
+    freeze = freeze_setup(ctx)
+    client = ctx.app.test_client()
+    response = recorder.measure(f'[freeze] {freeze.endpoint}', lambda: freeze.send(client))
+    if response.status_code != 201:
+        raise BenchmarkError(f'封榜失败: HTTP {response.status_code} {response.get_data(as_text=True)}')
+
+
+def _reveal_active_snapshot(ctx):
+    """揭榜并清理封榜状态，保证每次运行（包括 --skip-seed 复用数据）都从未封榜开始"""
+    with ctx.app.app_context():
+        if ScoreboardSnapshot.get_active() is None:
+            return
+    if not ctx.admin_token:
+        raise BenchmarkError(f'排行榜处于封榜状态且未找到压测管理员 {BENCH_ADMIN}，无法揭榜')
+
+    response = ctx.app.test_client().post(
+        '/api/ranking/reveal', headers={'Authorization': f'Bearer {ctx.admin_token}'}
+    )
+    if response.status_code != 200:
+        raise BenchmarkError(f'揭榜失败: HTTP {response.status_code} {response.get_data(as_text=True)}')
+
+
+def run_lifecycle(app, recorder, scale_factor=1.0, phases=None):
+    """
+    回放完整竞赛生命周期
+    Args:
+        app: Flask应用实例
+        recorder: 指标记录器
+        scale_factor: 请求数缩放系数
+        phases: 只运行指定阶段名（默认全部）
+    Returns:
+        LifecycleContext，ctx.skipped 记录因接口不存在而跳过的阶段
+    Raises:
+        BenchmarkError: 封榜或揭榜失败
+    """
+    ctx = LifecycleContext(app, scale_factor)
+    selected = set(phases) if phases else None
+
+    # 上次运行中断时可能遗留封榜状态
+    _reveal_active_snapshot(ctx)
+    try:
+        for phase, build, concurrency in PHASES:
+            if selected and phase not in selected:
+                continue
+
+            calls = build(ctx)
+            setup = [freeze_setup(ctx)] if phase == 'freeze' else []
+            missing = _missing_endpoints(app, setup + calls)
+            if missing:
+                ctx.skipped[phase] = missing
+                continue
+
+            if phase == 'freeze':
+                _run_freeze_setup(ctx, recorder)
+
+            responses = _run_calls(app, recorder, phase, calls, concurrency)
+
+            # 登录阶段拿到的令牌供后续阶段使用
+            if phase == 'login':
+                ctx.tokens = [
+                    token for token in (_extract_token(response) for _, response in responses)
+                    if token
+                ]
+    finally:
+        _reveal_active_snapshot(ctx)
+
+    return ctx
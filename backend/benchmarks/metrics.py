@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试指标采集
+Author: sunsky
+功能：按接口统计延迟分位数、吞吐量与每请求SQL次数
+"""
+
+import math
+import threading
+import time
+
+
+def percentile(values, pct):
+    """
+    计算分位数（最近秩法）
+    Args:
+        values: 已排序的数值列表
+        pct: 百分位，如 50、99
+    Returns:
+        分位数值，列表为空时返回0
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(pct / 100.0 * len(values)))
+    return values[rank - 1]
+
+
+class QueryCounter:
+    """
+    SQL执行计数器
+    基于SQLAlchemy的 before_cursor_execute 事件，按线程分别计数；
+    测试客户端在调用线程内执行视图函数，因此线程计数即为单个请求的SQL次数
+    """
+
+    def __init__(self, engine):
+        self.engine = engine
+        self._local = threading.local()
+
+    def _on_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self._local.count = getattr(self._local, 'count', 0) + 1
+
+    def install(self):
+        """注册事件监听"""
+        from sqlalchemy import event
+        event.listen(self.engine, 'before_cursor_execute', self._on_execute)
+
+    def uninstall(self):
+        """移除事件监听"""
+        from sqlalchemy import event
+        event.remove(self.engine, 'before_cursor_execute', self._on_execute)
+
+    def reset(self):
+        """清零当前线程计数"""
+        self._local.count = 0
+
+    @property
+    def count(self):
+        """当前线程累计的SQL次数"""
+        return getattr(self._local, 'count', 0)
+
+
+class EndpointStats:
+    """单个接口的统计数据"""
+
+    def __init__(self, name):
+        self.name = name
+        self.latencies = []
+        self.queries = []
+        self.errors = 0
+        self.elapsed = 0.0
+
+    def to_dict(self):
+        """汇总为报告字典（延迟单位：毫秒）"""
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+        return {
+            'count': count,
+            'errors': self.errors,
+            'p50_ms': round(percentile(latencies, 50) * 1000, 3),
+            'p99_ms': round(percentile(latencies, 99) * 1000, 3),
+            'mean_ms': round(sum(latencies) / count * 1000, 3) if count else 0.0,
+            'throughput_rps': round(count / self.elapsed, 2) if self.elapsed else 0.0,
+            'queries_per_request': round(sum(self.queries) / count, 2) if count else 0.0
+        }
+
+
+class Recorder:
+    """线程安全的指标记录器"""
+
+    def __init__(self, query_counter=None):
+        self.query_counter = query_counter
+        self.endpoints = {}
+        self._lock = threading.Lock()
+
+    def _stats(self, name):
+        if name not in self.endpoints:
+            self.endpoints[name] = EndpointStats(name)
+        return self.endpoints[name]
+
+    def measure(self, name, func):
+        """
+        执行一次请求并记录延迟、SQL次数和错误（非2xx/3xx响应）
+        Args:
+            name: 接口名称，如 'GET /api/ranking/scoreboard'
+            func: 发起请求的无参函数，返回响应对象
+        Returns:
+            响应对象
+        """
+        if self.query_counter:
+            self.query_counter.reset()
+        started = time.perf_counter()
+        response = func()
+        latency = time.perf_counter() - started
+        queries = self.query_counter.count if self.query_counter else 0
+
+        with self._lock:
+            stats = self._stats(name)
+            stats.latencies.append(latency)
+            stats.queries.append(queries)
+            # 4xx 也计为错误：接口不存在或前置条件失败时测到的不是目标路径
+            if not 200 <= response.status_code < 400:
+                stats.errors += 1
+        return response
+
+    def add_elapsed(self, names, elapsed):
+        """累加阶段耗时，用于计算吞吐量"""
+        with self._lock:
+            for name in names:
+                self._stats(name).elapsed += elapsed
+
+    def report(self):
+        """生成按接口名排序的报告"""
+        return {name: self.endpoints[name].to_dict() for name in sorted(self.endpoints)}
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试入口
+Author: sunsky
+功能：造数、回放竞赛生命周期、输出报告并与基线对比
+
+用法（在 backend 目录下执行）：
+    python -m benchmarks.run --scale small
+    python -m benchmarks.run --scale medium --save-baseline
+    BENCH_DATABASE_URL=postgresql://... python -m benchmarks.run --scale large
+"""
+
+import argparse
+import json
+import os
+import sys
+
+from app import create_app, db
+
+from .baseline import DEFAULT_TOLERANCE, compare_with_baseline, load_baseline, save_baseline
+from .lifecycle import PHASES, BenchmarkError, run_lifecycle
+from .metrics import QueryCounter, Recorder
+from .seed import SCALES, seed
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), 'baselines', 'baseline.json')
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description='CTF平台竞赛生命周期基准测试')
+    parser.add_argument('--scale', choices=sorted(SCALES), default='small', help='造数规模')
+    parser.add_argument('--requests', type=float, default=1.0, help='请求数缩放系数')
+    parser.add_argument('--phase', action='append', choices=[phase for phase, _, _ in PHASES],
+                        help='只运行指定阶段，可重复指定')
+    parser.add_argument('--skip-seed', action='store_true', help='复用已有数据，不重新造数')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='基线文件路径')
+    parser.add_argument('--save-baseline', action='store_true', help='将本次结果保存为新基线')
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help='延迟/吞吐量允许的波动比例')
+    parser.add_argument('--output', help='报告输出文件（JSON）')
+    return parser.parse_args(argv)
+
+
+def print_report(report):
+    """以表格形式打印报告"""
+    header = f"{'接口':<48}{'次数':>8}{'错误':>6}{'p50(ms)':>10}{'p99(ms)':>10}{'rps':>10}{'SQL/请求':>10}"
+    print(header)
+    print('-' * len(header))
+    for name, stats in report.items():
+        print(f"{name:<48}{stats['count']:>8}{stats['errors']:>6}{stats['p50_ms']:>10}"
+              f"{stats['p99_ms']:>10}{stats['throughput_rps']:>10}{stats['queries_per_request']:>10}")
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    app = create_app('benchmark')
+
+    with app.app_context():
+        if not args.skip_seed:
+            counts = seed(args.scale)
+            print(f"造数完成: {counts}")
+        counter = QueryCounter(db.engine)
+
+    counter.install()
+    try:
+        recorder = Recorder(counter)
+        ctx = run_lifecycle(app, recorder, scale_factor=args.requests, phases=args.phase)
+    except BenchmarkError as e:
+        print(f"压测中止: {e}")
+        return 2
+    finally:
+        counter.uninstall()
+
+    report = recorder.report()
+    print_report(report)
+    for phase, endpoints in ctx.skipped.items():
+        print(f"已跳过阶段 {phase}（接口不存在: {', '.join(endpoints)}）")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.save_baseline:
+        save_baseline(report, args.baseline)
+        print(f"基线已保存: {args.baseline}")
+        return 0
+
+    baseline = load_baseline(args.baseline)
+    if baseline is None:
+        print('未找到基线文件，跳过对比（使用 --save-baseline 生成）')
+        return 0
+
+    regressions = compare_with_baseline(report, baseline, args.tolerance)
+    if not regressions:
+        print('与基线对比：无性能回退')
+        return 0
+
+    print('与基线对比发现性能回退:')
+    for name, metric, base, current in regressions:
+        print(f"  {name} {metric}: {base} -> {current}")
+    return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试造数脚本
+Author: sunsky
+功能：按规模批量生成用户、团队、题目、提交数据，支持SQLite与PostgreSQL
+"""
+
+import random
+
+from app import db
+from app.models import User, UserProfile, Challenge, Category, Team
+
+from .factories import (
+    BENCH_ADMIN, UserFactory, UserProfileFactory, CategoryFactory, ChallengeFactory,
+    TeamFactory, TeamMemberFactory, SubmissionFactory
+)
+
+# 预设数据规模
+SCALES = {
+    'small': {'users': 200, 'teams': 50, 'challenges': 30, 'submissions': 2000},
+    'medium': {'users': 2000, 'teams': 500, 'challenges': 80, 'submissions': 30000},
+    'large': {'users': 10000, 'teams': 2500, 'challenges': 150, 'submissions': 200000},
+}
+
+# 每批写入的行数
+BATCH_SIZE = 1000
+
+
+def _ids(model):
+    """按主键顺序获取某张表的全部ID"""
+    return [row[0] for row in db.session.query(model.id).order_by(model.id).all()]
+
+
+def _bulk_save(objects):
+    """分批写入对象，避免单个事务过大"""
+    for start in range(0, len(objects), BATCH_SIZE):
+        db.session.add_all(objects[start:start + BATCH_SIZE])
+        db.session.commit()
+
+
+def seed(scale='small', reset=True, rng_seed=2025):
+    """
+    生成基准测试数据
+    Args:
+        scale: 数据规模，SCALES 中的键或自定义字典
+        reset: 是否先清空并重建所有表
+        rng_seed: 随机数种子，保证每次造出的数据一致
+    Returns:
+        实际生成的各类数据数量
+    """
+    sizes = SCALES[scale] if isinstance(scale, str) else scale
+    random.seed(rng_seed)
+
+    if reset:
+        db.drop_all()
+        db.create_all()
+
+    # 分类与题目
+    _bulk_save(CategoryFactory.build_batch(6))
+    category_ids = _ids(Category)
+    _bulk_save([
+        ChallengeFactory.build(category_id=random.choice(category_ids))
+        for _ in range(sizes['challenges'])
+    ])
+    challenge_points = dict(db.session.query(Challenge.id, Challenge.points).all())
+
+    # 用户与资料
+    _bulk_save(UserFactory.build_batch(sizes['users']))
+    user_ids = _ids(User)
+    _bulk_save([UserProfileFactory.build(user_id=user_id) for user_id in user_ids])
+
+    # 团队（每队最多4人）
+    _bulk_save(TeamFactory.build_batch(sizes['teams']))
+    team_ids = _ids(Team)
+    _bulk_save([
+        TeamMemberFactory.build(team_id=team_ids[index // 4], user_id=user_id)
+        for index, user_id in enumerate(user_ids[:len(team_ids) * 4])
+    ])
+
+    # 提交记录
+    challenge_ids = list(challenge_points)
+    submissions = [
+        SubmissionFactory.build(
+            user_id=random.choice(user_ids),
+            challenge_id=random.choice(challenge_ids)
+        )
+        for _ in range(sizes['submissions'])
+    ]
+    stats = {}
+    for sub in submissions:
+        entry = stats.setdefault(sub.user_id, {'count': 0, 'solved': set()})
+        entry['count'] += 1
+        if sub.is_correct:
+            entry['solved'].add(sub.challenge_id)
+    _bulk_save(submissions)
+
+    # 管理员账号（不参与排行）
+    _bulk_save([UserFactory.build(username=BENCH_ADMIN, is_admin=True)])
+
+    # 回填统计字段，保证排行榜有真实分布（逐个调用 update_statistics 在大规模下过慢）
+    mappings = []
+    for profile_id, user_id in db.session.query(UserProfile.id, UserProfile.user_id).all():
+        entry = stats.get(user_id)
+        if not entry:
+            continue
+        mappings.append({
+            'id': profile_id,
+            'submission_count': entry['count'],
+            'solved_count': len(entry['solved']),
+            'total_score': sum(challenge_points[cid] for cid in entry['solved'])
+        })
+    db.session.bulk_update_mappings(UserProfile, mappings)
+    db.session.commit()
+
+    return {
+        'users': len(user_ids),
+        'teams': len(team_ids),
+        'challenges': len(challenge_points),
+        'submissions': len(submissions)
+    }
@@ -71,11 +71,41 @@ class Config:
     COMPETITION_START_TIME = os.environ.get('COMPETITION_START_TIME')
     COMPETITION_END_TIME = os.environ.get('COMPETITION_END_TIME')
     COMPETITION_NAME = os.environ.get('COMPETITION_NAME') or 'CTF竞赛平台'
-    
+
+    # 排行榜配置
+    SCOREBOARD_SIZE = 100
+    SCOREBOARD_CACHE_TIMEOUT = 10  # 公开实时排行榜缓存秒数
+    SCOREBOARD_REVEAL_INTERVAL = 0.5  # 揭榜事件推送间隔（秒）
+
     # 分页配置
     POSTS_PER_PAGE = 20
     CHALLENGES_PER_PAGE = 12
     USERS_PER_PAGE = 50
+    NOTIFICATIONS_PER_PAGE = 20
+    AUDIT_LOGS_PER_PAGE = 50
+    
+    # 通知配置
+    NOTIFICATION_COUNTER_CACHE_TIMEOUT = 300  # 未读计数与已读游标缓存秒数
+    
+    # 审计日志配置
+    AUDIT_LOG_BATCH_SIZE = 200  # 每批写入条数
+    AUDIT_LOG_FLUSH_INTERVAL = 2.0  # 最长刷新间隔（秒）
+    AUDIT_LOG_QUEUE_SIZE = 10000  # 进程内队列容量，满后改为同步写入
+    AUDIT_LOG_SYNCHRONOUS = False
+    AUDIT_LOG_RETENTION_MONTHS = 12  # 保留月数，更早的分区可归档
+    AUDIT_LOG_NODE_ID = int(os.environ.get('AUDIT_LOG_NODE_ID') or 0)  # 主机号（0~63），多主机部署时每台不同
+    
+    # 题目实例配置（实例状态保存在进程内存中，只在单worker的实例服务进程中开启）
+    INSTANCE_MANAGER_ENABLED = os.environ.get('INSTANCE_MANAGER_ENABLED', 'false').lower() in ['true', 'on', '1']
+    INSTANCE_RUNTIME = os.environ.get('INSTANCE_RUNTIME') or 'docker'  # docker / local
+    INSTANCE_HOST = os.environ.get('INSTANCE_HOST') or '127.0.0.1'  # 选手访问实例的主机地址
+    INSTANCE_TTL = 3600  # 实例存活秒数，到期自动回收
+    INSTANCE_TEAM_QUOTA = 3  # 每队同时持有的实例上限
+    INSTANCE_POOL_LOW_WATERMARK = 2  # 预热实例低于该数时开始补充
+    INSTANCE_POOL_HIGH_WATERMARK = 5  # 补充到该数量为止
+    INSTANCE_MAX_CONCURRENT_STARTS = 4  # 同时启动的实例上限
+    INSTANCE_REAP_INTERVAL = 30  # 回收检查间隔（秒）
+    INSTANCE_CHALLENGES = {}  # 需要独立实例的题目，如 {'web-001': {'image': 'qhuctf/web-001', 'port': 80}}
     
     @staticmethod
     def init_app(app):
@@ -198,12 +228,19 @@ class TestingConfig(Config):
     DEBUG = True
     TESTING = True
     
-    # 测试数据库（内存SQLite）
+    # 测试数据库（内存SQLite，不支持连接池参数）
     SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    SQLALCHEMY_ENGINE_OPTIONS = {}
     
     # 测试环境禁用CSRF
     WTF_CSRF_ENABLED = False
     
+    # 测试环境审计日志同步写入
+    AUDIT_LOG_SYNCHRONOUS = True
+    
+    # 测试环境使用本地进程模拟题目实例
+    INSTANCE_RUNTIME = 'local'
+    
     # 测试环境缓存
     CACHE_TYPE = 'simple'
     
@@ -223,10 +260,41 @@ class TestingConfig(Config):
         app.logger.setLevel(logging.CRITICAL)
 
 
+class BenchmarkConfig(Config):
+    """性能基准测试环境配置"""
+    DEBUG = False
+    TESTING = True
+
+    # 基准数据库（默认文件SQLite，多线程压测不能使用内存库；可通过环境变量切换到PostgreSQL）
+    SQLALCHEMY_DATABASE_URI = os.environ.get('BENCH_DATABASE_URL') or \
+        'sqlite:///' + os.path.join(os.path.dirname(__file__), 'ctf_bench.db')
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'pool_pre_ping': True
+    }
+
+    # 压测时关闭限流与CSRF，避免干扰测量结果
+    WTF_CSRF_ENABLED = False
+    RATELIMIT_ENABLED = False
+
+    # 视图异常按500响应返回并计为错误，而不是从测试客户端抛出中止整个阶段
+    PROPAGATE_EXCEPTIONS = False
+
+    # 基准环境缓存（进程内缓存，结果不依赖外部Redis）
+    CACHE_TYPE = 'simple'
+
+    @classmethod
+    def init_app(cls, app):
+        Config.init_app(app)
+
+        import logging
+        app.logger.setLevel(logging.ERROR)
+
+
 # 配置字典
 config = {
     'development': DevelopmentConfig,
     'production': ProductionConfig,
     'testing': TestingConfig,
+    'benchmark': BenchmarkConfig,
     'default': DevelopmentConfig
 }
\ No newline at end of file
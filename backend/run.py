@@ -17,25 +17,27 @@ def deploy():
     app = create_app(os.getenv('FLASK_ENV') or 'development')
     
     with app.app_context():
-        # 创建数据库表
+        # 创建数据库表（PostgreSQL下 admin_logs 建表时同时创建初始分区）
         db.create_all()
         
-        # 运行数据库迁移
-        try:
-            upgrade()
-        except Exception as e:
-            print(f"数据库迁移失败: {e}")
+        # 运行数据库迁移（没有迁移目录时 upgrade 会直接退出进程，需先判断）
+        if os.path.isdir(app.extensions['migrate'].directory):
+            try:
+                upgrade()
+            except Exception as e:
+                print(f"数据库迁移失败: {e}")
+        
+        # 审计日志分区（已有部署每次发布时补齐当月及未来月份）
+        from app.controllers.audit import ensure_partitions
+        ensure_partitions()
         
         # 创建初始管理员用户
         from app.models.user import User
         admin = User.query.filter_by(username='admin').first()
         if not admin:
-            admin = User(
-                username='admin',
-                email='admin@ctf.local',
-                is_admin=True,
-                is_active=True
-            )
+            admin = User(username='admin', email='admin@ctf.local')
+            admin.is_admin = True
+            admin.is_active = True
             admin.set_password('admin123')  # 生产环境需要修改
             db.session.add(admin)
             db.session.commit()
@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台测试清理脚本
+Author: sunsky
+功能：删除测试目录下的全部测试文件与缓存
+
+用法（在 backend 目录下执行）：
+    python tests/clean_tests.py --yes
+"""
+
+import os
+import shutil
+import sys
+
+TESTS_DIR = os.path.dirname(os.path.abspath(__file__))
+
+
+def clean(dry_run=True):
+    """删除 test_*.py、conftest.py 与 __pycache__/.pytest_cache，返回处理的路径"""
+    removed = []
+    for root, dirs, files in os.walk(TESTS_DIR, topdown=False):
+        for name in files:
+            if (name.startswith('test_') and name.endswith('.py')) or name == 'conftest.py':
+                path = os.path.join(root, name)
+                removed.append(path)
+                if not dry_run:
+                    os.remove(path)
+        for name in dirs:
+            if name in ('__pycache__', '.pytest_cache'):
+                path = os.path.join(root, name)
+                removed.append(path)
+                if not dry_run:
+                    shutil.rmtree(path, ignore_errors=True)
+    return removed
+
+
+if __name__ == '__main__':
+    confirmed = '--yes' in sys.argv
+    for path in clean(dry_run=not confirmed):
+        print(('已删除: ' if confirmed else '将删除: ') + os.path.relpath(path, TESTS_DIR))
+    if not confirmed:
+        print('预览模式，确认删除请加 --yes 参数')
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台测试公共夹具
+Author: sunsky
+功能：测试应用、数据库、客户端与登录令牌
+"""
+
+import pytest
+
+
+@pytest.fixture
+def app():
+    """测试应用（内存SQLite，每个用例独立建表）"""
+    from app import create_app, cache, db
+
+    app = create_app('testing')
+    with app.app_context():
+        db.create_all()
+        cache.clear()
+        yield app
+        db.session.remove()
+        db.drop_all()
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+@pytest.fixture
+def make_user(app):
+    """创建用户（附带资料），返回用户对象"""
+    from werkzeug.security import generate_password_hash
+
+    from app import db
+    from app.models import User, UserProfile
+
+    # 密码哈希计算较慢，所有测试用户共用一个
+    password_hash = generate_password_hash('password')
+
+    def _make_user(username, is_admin=False, total_score=0, solved_count=0):
+        user = User(username=username, email=f'{username}@test.local')
+        user.password_hash = password_hash
+        user.is_active = True
+        user.is_admin = is_admin
+        db.session.add(user)
+        db.session.flush()
+        db.session.add(UserProfile(
+            user_id=user.id, nickname=username,
+            total_score=total_score, solved_count=solved_count
+        ))
+        db.session.commit()
+        return user
+
+    return _make_user
+
+
+@pytest.fixture
+def auth_headers():
+    """为用户生成请求头"""
+    def _auth_headers(user):
+        access_token, _ = user.generate_tokens()
+        return {'Authorization': f'Bearer {access_token}'}
+
+    return _auth_headers
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台审计日志测试
+Author: sunsky
+功能：分区建表语句、日志ID、日志写入与查询、非PostgreSQL下的归档
+"""
+
+from datetime import datetime
+
+import pytest
+
+
+def test_partition_statements_cover_default_and_months(app):
+    from app.controllers.audit import partition_statements
+
+    statements = partition_statements(months_ahead=1, now=datetime(2025, 12, 15))
+    names = [name for name, _ in statements]
+    assert names == ['admin_logs_default', 'admin_logs_y2025m12', 'admin_logs_y2026m01']
+    assert 'DEFAULT' in statements[0][1]
+    assert "FROM ('2025-12-01') TO ('2026-01-01')" in statements[1][1]
+    assert "FROM ('2026-01-01') TO ('2026-02-01')" in statements[2][1]
+
+
+def test_ensure_partitions_is_noop_without_postgresql(app):
+    from app.controllers.audit import ensure_partitions
+
+    assert ensure_partitions() == []
+
+
+def test_log_ids_are_increasing():
+    from app.utils.audit import generate_log_id
+
+    ids = [generate_log_id() for _ in range(1000)]
+    assert ids == sorted(ids)
+    assert len(set(ids)) == len(ids)
+
+
+def test_log_id_contains_host_id():
+    from app.utils import audit
+
+    try:
+        audit.configure_node(5)
+        node = (audit.generate_log_id() >> audit.SEQUENCE_BITS) & ((1 << 16) - 1)
+        assert node >> audit.SLOT_BITS == 5
+    finally:
+        audit.configure_node(0)
+
+    with pytest.raises(ValueError):
+        audit.configure_node(64)
+
+
+def test_worker_slots_are_unique_on_host():
+    from app.utils import audit
+
+    claimed = [audit._claim_slot() for _ in range(3)]
+    try:
+        slots = [slot for slot, _ in claimed]
+        if all(lock_file is not None for _, lock_file in claimed):
+            assert len(set(slots)) == 3
+    finally:
+        for _, lock_file in claimed:
+            if lock_file:
+                lock_file.close()
+
+
+def test_search_pages_by_index(app):
+    from app import db
+    from app.models import AdminLog
+
+    query = AdminLog.query.filter(AdminLog.admin_id == 1, AdminLog.id < 100).order_by(AdminLog.id.desc())
+    sql = str(query.statement.compile(db.engine, compile_kwargs={'literal_binds': True}))
+    plan = ' '.join(str(row) for row in db.session.execute(db.text(f'EXPLAIN QUERY PLAN {sql}')))
+    assert 'ix_admin_logs_admin_id_id' in plan
+    assert 'TEMP B-TREE' not in plan
+
+
+def test_log_and_query(app):
+    from app.controllers.audit import query_logs
+    from app.utils.audit import audit_log
+
+    audit_log.log(1, 'ban_user', 'user', 10, details={'reason': 'test'})
+    audit_log.log(1, 'update_challenge', 'challenge', 3)
+    audit_log.log(2, 'ban_user', 'user', 11)
+
+    items, next_before_id = query_logs(admin_id=1)
+    assert [item['action'] for item in items] == ['update_challenge', 'ban_user']
+    assert items[1]['details'] == {'reason': 'test'}
+    assert next_before_id is None
+
+    items, next_before_id = query_logs(target_type='user', limit=1)
+    assert len(items) == 1 and next_before_id == items[0]['id']
+
+
+def test_archive_deletes_rows_without_postgresql(app):
+    from app import db
+    from app.controllers.audit import archive_partitions_before
+    from app.models import AdminLog
+
+    db.session.add(AdminLog(id=1, created_at=datetime(2025, 1, 10), admin_id=1, action='old'))
+    db.session.add(AdminLog(id=2, created_at=datetime(2025, 3, 10), admin_id=1, action='new'))
+    db.session.commit()
+
+    assert archive_partitions_before(datetime(2025, 2, 20)) == 1
+    assert [log.action for log in AdminLog.query.all()] == ['new']
+
+
+def test_deploy_without_migrations(monkeypatch, capsys):
+    import run
+
+    monkeypatch.setenv('FLASK_ENV', 'testing')
+    run.deploy()
+    assert '创建默认管理员用户' in capsys.readouterr().out
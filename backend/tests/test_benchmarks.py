@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台基准测试工具单元测试
+Author: sunsky
+功能：分位数、接口统计、错误计数、基线对比与生命周期回放
+"""
+
+from benchmarks.baseline import compare_with_baseline, load_baseline, save_baseline
+from benchmarks.metrics import EndpointStats, Recorder, percentile
+
+
+def _stats(**overrides):
+    data = {
+        'count': 100, 'errors': 0, 'p50_ms': 10.0, 'p99_ms': 50.0,
+        'mean_ms': 12.0, 'throughput_rps': 200.0, 'queries_per_request': 3.0
+    }
+    data.update(overrides)
+    return data
+
+
+def test_percentile_nearest_rank():
+    values = list(range(1, 101))
+    assert percentile(values, 50) == 50
+    assert percentile(values, 99) == 99
+    assert percentile([7], 99) == 7
+    assert percentile([], 50) == 0.0
+
+
+def test_endpoint_stats_to_dict():
+    stats = EndpointStats('GET /api/ranking/scoreboard')
+    stats.latencies = [0.001, 0.002, 0.003, 0.004]
+    stats.queries = [2, 2, 4, 4]
+    stats.elapsed = 2.0
+
+    data = stats.to_dict()
+    assert data['count'] == 4
+    assert data['p50_ms'] == 2.0
+    assert data['p99_ms'] == 4.0
+    assert data['throughput_rps'] == 2.0
+    assert data['queries_per_request'] == 3.0
+
+
+def test_compare_within_tolerance_has_no_regression():
+    baseline = {'GET /a': _stats()}
+    report = {'GET /a': _stats(p99_ms=55.0, throughput_rps=180.0)}
+    assert compare_with_baseline(report, baseline, tolerance=0.2) == []
+
+
+def test_compare_detects_regressions():
+    baseline = {'GET /a': _stats()}
+    report = {'GET /a': _stats(p99_ms=80.0, throughput_rps=100.0, queries_per_request=4.0, errors=1)}
+
+    metrics = {metric for _, metric, _, _ in compare_with_baseline(report, baseline, tolerance=0.2)}
+    assert metrics == {'p99_ms', 'throughput_rps', 'queries_per_request', 'errors'}
+
+
+def test_compare_ignores_new_endpoints():
+    assert compare_with_baseline({'GET /new': _stats()}, {}) == []
+
+
+def test_baseline_round_trip(tmp_path):
+    path = str(tmp_path / 'baselines' / 'baseline.json')
+    assert load_baseline(path) is None
+
+    report = {'GET /a': _stats()}
+    save_baseline(report, path)
+    assert load_baseline(path) == report
+
+
+class _Response:
+    def __init__(self, status_code):
+        self.status_code = status_code
+
+
+def test_recorder_counts_non_success_as_errors():
+    recorder = Recorder()
+    for status_code in (200, 201, 302, 401, 404, 409, 500):
+        recorder.measure('GET /a', lambda: _Response(status_code))
+    assert recorder.report()['GET /a']['errors'] == 4
+
+
+def test_lifecycle_skips_missing_endpoints_and_reveals(app):
+    from app.models import ScoreboardSnapshot
+    from benchmarks.lifecycle import run_lifecycle
+    from benchmarks.seed import seed
+
+    seed({'users': 20, 'teams': 5, 'challenges': 5, 'submissions': 50})
+    recorder = Recorder()
+    ctx = run_lifecycle(app, recorder, scale_factor=0.01)
+
+    assert set(ctx.skipped) == {'registration', 'login', 'release'}
+    report = recorder.report()
+    assert report['[freeze] POST /api/ranking/freeze']['errors'] == 0
+    assert report['[polling] GET /api/ranking/scoreboard']['errors'] == 0
+    # 运行结束后揭榜，下一次运行从未封榜开始
+    assert ScoreboardSnapshot.get_active() is None
+    run_lifecycle(app, Recorder(), scale_factor=0.01, phases=['freeze'])
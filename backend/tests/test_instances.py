@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台题目实例管理器测试
+Author: sunsky
+功能：使用本地进程运行时测试启动预热、水位补充、异步启动、取消注册、配额（含启动中）、TTL回收、命中统计与释放归属
+"""
+
+from datetime import datetime, timedelta
+import logging
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+# 实例进程只需存活即可，不必真正提供服务
+SLEEP_COMMAND = [sys.executable, '-c', 'import time; time.sleep(60)']
+
+
+def _spec(low, high):
+    return {'command': SLEEP_COMMAND, 'low_watermark': low, 'high_watermark': high}
+
+
+def _wait_until(predicate, timeout=10.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.05)
+    return predicate()
+
+
+def _gated_runtime():
+    """启动前等待放行的本地进程运行时，用于构造"启动中"状态"""
+    from app.instances import LocalProcessRuntime
+
+    class GatedRuntime(LocalProcessRuntime):
+        def __init__(self, host='127.0.0.1'):
+            super().__init__(host)
+            self.gate = threading.Event()
+            self.started = []
+
+        def start(self, challenge_id, spec):
+            self.gate.wait(10)
+            instance = super().start(challenge_id, spec)
+            self.started.append(instance)
+            return instance
+
+    return GatedRuntime()
+
+
+@pytest.fixture
+def make_manager():
+    from app.instances import InstanceManager, LocalProcessRuntime
+
+    managers = []
+
+    def _make_manager(challenges=None, runtime=None, **config):
+        app = SimpleNamespace(
+            config={
+                'INSTANCE_RUNTIME': 'local',
+                'INSTANCE_TEAM_QUOTA': 3,
+                'INSTANCE_REAP_INTERVAL': 3600,
+                'INSTANCE_CHALLENGES': challenges or {},
+                **config
+            },
+            extensions={},
+            logger=logging.getLogger('test_instances')
+        )
+        manager = InstanceManager()
+        manager.init_app(app, runtime=runtime or LocalProcessRuntime())
+        managers.append(manager)
+        return manager
+
+    yield _make_manager
+    for manager in managers:
+        manager.shutdown()
+
+
+def test_pools_prewarmed_on_init(make_manager):
+    manager = make_manager({'web': _spec(1, 2)})
+    assert _wait_until(lambda: len(manager.pools['web']) == 2)
+    assert manager.get_metrics()['misses'] == 0
+
+
+def test_refill_only_below_low_watermark(make_manager):
+    manager = make_manager({'web': _spec(2, 3)})
+    pool = manager.pools['web']
+    assert _wait_until(lambda: len(pool) == 3)
+
+    manager.acquire('web', team_id=1)
+    time.sleep(0.3)
+    assert len(pool) == 2 and pool.starting == 0
+
+    manager.acquire('web', team_id=2)
+    assert _wait_until(lambda: len(pool) == 3)
+
+
+def test_hit_and_miss_metrics(make_manager):
+    manager = make_manager({'cold': _spec(0, 0), 'warm': _spec(1, 1)})
+    assert _wait_until(lambda: len(manager.pools['warm']) == 1)
+
+    cold, error = manager.acquire('cold', team_id=1)
+    assert error is None and cold.team_id == 1
+    warm, error = manager.acquire('warm', team_id=1)
+    assert error is None
+
+    metrics = manager.get_metrics()
+    assert metrics['hits'] == 1 and metrics['misses'] == 1
+    assert metrics['hit_rate'] == 0.5
+    assert metrics['challenges']['cold']['misses'] == 1
+    assert metrics['challenges']['warm']['hits'] == 1
+
+
+def test_acquire_returns_existing_instance(make_manager):
+    manager = make_manager({'web': _spec(0, 0)})
+    first, _ = manager.acquire('web', team_id=1)
+    second, _ = manager.acquire('web', team_id=1)
+    assert first is second
+    assert len(manager.get_team_instances(1)) == 1
+
+
+def test_quota_counts_pending_acquisitions(make_manager):
+    runtime = _gated_runtime()
+    manager = make_manager(
+        {'a': _spec(0, 0), 'b': _spec(0, 0)}, runtime=runtime, INSTANCE_TEAM_QUOTA=1
+    )
+
+    results = []
+    worker = threading.Thread(target=lambda: results.append(manager.acquire('a', team_id=1)))
+    worker.start()
+    assert _wait_until(lambda: manager._pending)
+
+    # 启动中的实例计入配额，同一题目重复申请提示等待
+    instance, error = manager.acquire('b', team_id=1)
+    assert instance is None and '最多' in error
+    instance, error = manager.acquire('a', team_id=1)
+    assert instance is None and '启动中' in error
+
+    runtime.gate.set()
+    worker.join(10)
+    assert results[0][1] is None
+
+    instance, error = manager.acquire('b', team_id=1)
+    assert instance is None and '最多' in error
+    instance, error = manager.acquire('b', team_id=2)
+    assert error is None
+
+
+def test_reap_expired_instances(make_manager):
+    manager = make_manager({'web': _spec(0, 0)}, INSTANCE_TTL=60)
+    instance, _ = manager.acquire('web', team_id=1)
+    assert instance.expires_at - instance.assigned_at == timedelta(seconds=60)
+
+    assert manager.reap() == 0
+    assert manager.reap(now=datetime.utcnow() + timedelta(seconds=61)) == 1
+    assert manager.get_team_instances(1) == []
+    assert not manager.runtime.is_alive(instance)
+
+
+def test_reap_prunes_dead_pooled_instances(make_manager):
+    manager = make_manager({'web': _spec(1, 1)})
+    pool = manager.pools['web']
+    assert _wait_until(lambda: len(pool) == 1)
+
+    manager.runtime.stop(pool.ready[0])
+    manager.reap()
+    assert len(pool) == 0
+
+
+def test_release_checks_ownership(make_manager):
+    manager = make_manager({'web': _spec(0, 0)})
+    instance, _ = manager.acquire('web', team_id=1)
+
+    assert manager.release(instance.id, 2) is False
+    assert manager.release(instance.id, None) is False
+    assert manager.release('missing', 1) is False
+    assert manager.release(instance.id, 1) is True
+    assert not manager.runtime.is_alive(instance)
+    assert manager.release(instance.id, 1) is False
+
+
+def test_force_release_ignores_owner(make_manager):
+    manager = make_manager({'web': _spec(0, 0)})
+    instance, _ = manager.acquire('web', team_id=1)
+
+    assert manager.force_release(instance.id) is True
+    assert manager.get_team_instances(1) == []
+    assert manager.force_release(instance.id) is False
+
+
+def test_refill_does_not_wait_for_starts(make_manager):
+    runtime = _gated_runtime()
+    manager = make_manager(runtime=runtime)
+    manager.register('web', _spec(3, 3))
+    pool = manager.pools['web']
+    assert _wait_until(lambda: pool.starting == 3)
+
+    # 启动被阻塞时补充与回收仍立即返回
+    started = time.monotonic()
+    manager.refill()
+    manager.reap()
+    assert time.monotonic() - started < 1.0
+    assert pool.starting == 3
+
+    runtime.gate.set()
+    assert _wait_until(lambda: len(pool) == 3)
+
+
+def test_start_finishing_after_unregister_is_stopped(make_manager):
+    runtime = _gated_runtime()
+    manager = make_manager(runtime=runtime)
+    manager.register('web', _spec(1, 1))
+    pool = manager.pools['web']
+    assert _wait_until(lambda: pool.starting == 1)
+
+    manager.unregister('web')
+    runtime.gate.set()
+    assert _wait_until(lambda: pool.starting == 0)
+    assert len(pool) == 0
+    assert len(runtime.started) == 1
+    assert _wait_until(lambda: not runtime.is_alive(runtime.started[0]))
+
+
+def test_reregister_stops_old_pool(make_manager):
+    manager = make_manager({'web': _spec(1, 1)})
+    old_pool = manager.pools['web']
+    assert _wait_until(lambda: len(old_pool) == 1)
+    old_instance = old_pool.ready[0]
+
+    manager.register('web', _spec(1, 1))
+    assert len(old_pool) == 0
+    assert not manager.runtime.is_alive(old_instance)
+    assert _wait_until(lambda: len(manager.pools['web']) == 1)
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台站内通知测试
+Author: sunsky
+功能：未读计数缓存增量维护、全部已读、管理员批量发送参数校验
+"""
+
+import pytest
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user('admin', is_admin=True)
+
+
+@pytest.fixture
+def player(make_user):
+    return make_user('player')
+
+
+def _forbid_recount(monkeypatch):
+    """缓存命中时不应访问数据库重算计数"""
+    from app.controllers import notification
+
+    def fail(user_id):
+        raise AssertionError('未读计数未命中缓存')
+
+    monkeypatch.setattr(notification, 'get_cursor', fail)
+
+
+def test_send_increments_cached_unread_count(app, player, monkeypatch):
+    from app.controllers.notification import get_unread_count, send_notifications
+
+    assert get_unread_count(player.id)['notifications'] == 0
+    send_notifications([player.id], '通知1')
+    send_notifications([player.id], '通知2')
+
+    _forbid_recount(monkeypatch)
+    assert get_unread_count(player.id)['notifications'] == 2
+
+
+def test_send_does_not_create_uncached_counters(app, player):
+    from app import cache
+    from app.controllers.notification import UNREAD_KEY, get_unread_count, send_notifications
+
+    send_notifications([player.id], '通知1')
+    assert cache.get(UNREAD_KEY.format(player.id)) is None
+    assert get_unread_count(player.id)['notifications'] == 1
+
+
+def test_unread_count_cached_with_finite_timeout(app, player, monkeypatch):
+    from app import cache
+    from app.controllers.notification import get_unread_count
+
+    timeouts = []
+    original = cache.set_many
+    monkeypatch.setattr(
+        cache, 'set_many',
+        lambda mapping, timeout=None: timeouts.append(timeout) or original(mapping, timeout=timeout)
+    )
+    get_unread_count(player.id)
+    assert timeouts == [app.config['NOTIFICATION_COUNTER_CACHE_TIMEOUT']]
+    assert timeouts[0] > 0
+
+
+def test_mark_all_read_then_send(app, player, monkeypatch):
+    from app.controllers.notification import (
+        get_unread_count, mark_all_read, publish_announcement, send_notifications
+    )
+
+    send_notifications([player.id], '通知1')
+    publish_announcement('公告', '内容')
+    assert get_unread_count(player.id)['total'] == 2
+
+    mark_all_read(player.id)
+    send_notifications([player.id], '通知2')
+
+    with monkeypatch.context() as patch:
+        _forbid_recount(patch)
+        assert get_unread_count(player.id)['total'] == 1
+
+
+def test_send_rejects_non_integer_ids(client, admin, player, auth_headers):
+    response = client.post('/api/notification/send', headers=auth_headers(admin), json={
+        'user_ids': [player.id, 'abc'], 'title': '通知'
+    })
+    assert response.status_code == 400
+
+
+def test_send_skips_unknown_users(client, admin, player, auth_headers):
+    from app.models import Notification
+
+    response = client.post('/api/notification/send', headers=auth_headers(admin), json={
+        'user_ids': [str(player.id), player.id, 99999], 'title': '通知'
+    })
+    assert response.status_code == 201
+    assert response.get_json()['count'] == 1
+    assert Notification.query.filter_by(user_id=player.id).count() == 1
+
+    response = client.post('/api/notification/send', headers=auth_headers(admin), json={
+        'user_ids': [99999], 'title': '通知'
+    })
+    assert response.status_code == 400
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+CTF竞赛平台排行榜封榜/揭榜测试
+Author: sunsky
+功能：快照条数限制、快照缺失回退、重复封榜、揭榜事件缓存与推送间隔
+"""
+
+import pytest
+
+
+@pytest.fixture
+def admin(make_user):
+    return make_user('admin', is_admin=True)
+
+
+@pytest.fixture
+def players(make_user):
+    return [make_user(f'player{index}', total_score=100 - index) for index in range(5)]
+
+
+def test_snapshot_is_limited_to_scoreboard_size(app, client, admin, players, auth_headers):
+    app.config['SCOREBOARD_SIZE'] = 3
+    assert client.post('/api/ranking/freeze', headers=auth_headers(admin)).status_code == 201
+
+    data = client.get('/api/ranking/scoreboard').get_json()
+    assert data['frozen'] is True
+    assert [entry['username'] for entry in data['entries']] == ['player0', 'player1', 'player2']
+
+
+def test_missing_snapshot_falls_back_to_live(app, client, admin, players, auth_headers):
+    from app import cache, db
+    from app.controllers.scoreboard import ACTIVE_SNAPSHOT_KEY
+    from app.models import ScoreboardSnapshot
+
+    client.post('/api/ranking/freeze', headers=auth_headers(admin))
+    snapshot = ScoreboardSnapshot.get_active()
+    cache.set(ACTIVE_SNAPSHOT_KEY, snapshot.id, timeout=0)
+    db.session.delete(snapshot)
+    db.session.commit()
+
+    response = client.get('/api/ranking/scoreboard')
+    assert response.status_code == 200
+    assert response.get_json()['frozen'] is False
+
+
+def test_freeze_twice_conflicts(app, players):
+    from app.controllers.scoreboard import freeze_scoreboard
+
+    snapshot, error = freeze_scoreboard()
+    assert snapshot and error is None
+    snapshot, error = freeze_scoreboard()
+    assert snapshot is None and error
+
+
+def test_active_snapshot_unique_index(app, players):
+    from sqlalchemy.exc import IntegrityError
+
+    from app import db
+    from app.models import ScoreboardSnapshot
+
+    db.session.add(ScoreboardSnapshot(data='[]'))
+    db.session.commit()
+    db.session.add(ScoreboardSnapshot(data='[]'))
+    with pytest.raises(IntegrityError):
+        db.session.commit()
+    db.session.rollback()
+
+
+def test_revealed_events_are_cached(app, players, monkeypatch):
+    from app.controllers import scoreboard
+    from app.controllers.scoreboard import freeze_scoreboard, get_reveal_events, reveal_scoreboard
+
+    freeze_scoreboard()
+    snapshot, _ = reveal_scoreboard()
+
+    calls = []
+    original = scoreboard.build_reveal_events
+    monkeypatch.setattr(
+        scoreboard, 'build_reveal_events',
+        lambda snapshot: calls.append(snapshot.id) or original(snapshot)
+    )
+    get_reveal_events(snapshot)
+    get_reveal_events(snapshot)
+    assert calls == [snapshot.id]
+
+
+def test_reveal_interval_ignored_for_players(app, client, players, monkeypatch):
+    from app.controllers.scoreboard import freeze_scoreboard, reveal_scoreboard
+    from app.routes import ranking
+
+    freeze_scoreboard()
+    reveal_scoreboard()
+    app.config['SCOREBOARD_REVEAL_INTERVAL'] = 0.5
+
+    sleeps = []
+    monkeypatch.setattr(ranking.time, 'sleep', sleeps.append)
+    monkeypatch.setattr(ranking, 'get_reveal_events', lambda snapshot: [{'user_id': 1}])
+
+    response = client.get('/api/ranking/reveal/stream?interval=0')
+    response.get_data()
+    assert sleeps == [0.5]
+
+
+def test_reveal_interval_clamped_for_admin(app, client, admin, players, auth_headers, monkeypatch):
+    from app.controllers.scoreboard import freeze_scoreboard
+    from app.routes import ranking
+
+    freeze_scoreboard()
+    sleeps = []
+    monkeypatch.setattr(ranking.time, 'sleep', sleeps.append)
+    monkeypatch.setattr(ranking, 'get_reveal_events', lambda snapshot: [{'user_id': 1}])
+
+    response = client.get('/api/ranking/reveal/stream?interval=3600', headers=auth_headers(admin))
+    response.get_data()
+    assert sleeps == [ranking.MAX_REVEAL_INTERVAL]
+
+
+def test_snapshot_payload_unchanged_by_reveal(app, client, admin, players, auth_headers):
+    from app.models import ScoreboardSnapshot
+
+    client.post('/api/ranking/freeze', headers=auth_headers(admin))
+    snapshot_id = ScoreboardSnapshot.get_active().id
+    url = f'/api/ranking/scoreboard/snapshots/{snapshot_id}'
+
+    frozen = client.get(url)
+    assert 'immutable' in frozen.headers['Cache-Control']
+    assert 'is_active' not in frozen.get_json()
+    assert 'revealed_at' not in frozen.get_json()
+
+    client.post('/api/ranking/reveal', headers=auth_headers(admin))
+    assert client.get(url).get_json() == frozen.get_json()